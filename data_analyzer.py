@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 import streamlit as st
 from typing import Dict, List, Tuple, Optional
 
+from utils import dataframe_fingerprint, linear_trend
+
 
 class DataAnalyzer:
     """30일 데이터 분석 클래스"""
@@ -16,33 +18,39 @@ class DataAnalyzer:
     def __init__(self):
         self.analysis_cache = {}
     
-    def analyze_30day_data(self, data: pd.DataFrame) -> Dict:
-        """30일 데이터의 종합 분석을 수행합니다."""
+    @st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def analyze_30day_data(_self, data: pd.DataFrame) -> Dict:
+        """30일 데이터의 종합 분석을 수행합니다 (동일 데이터는 캐시 재사용)."""
         if data.empty:
             return {}
         
         analysis = {
-            'basic_info': self._get_basic_info(data),
-            'temperature_analysis': self._analyze_temperature(data),
-            'humidity_analysis': self._analyze_humidity(data),
-            'monthly_analysis': self._analyze_monthly_patterns(data),
-            'outlier_analysis': self._detect_outliers(data),
-            'trend_analysis': self._analyze_trends(data),
-            'correlation_analysis': self._analyze_correlations(data),
-            'volatility_analysis': self._analyze_volatility(data)
+            'basic_info': _self._get_basic_info(data),
+            'temperature_analysis': _self._analyze_temperature(data),
+            'humidity_analysis': _self._analyze_humidity(data),
+            'monthly_analysis': _self._analyze_monthly_patterns(data),
+            'outlier_analysis': _self._detect_outliers(data),
+            'trend_analysis': _self._analyze_trends(data),
+            'correlation_analysis': _self._analyze_correlations(data),
+            'volatility_analysis': _self._analyze_volatility(data)
         }
         
         return analysis
     
     def _get_basic_info(self, data: pd.DataFrame) -> Dict:
         """기본 정보를 추출합니다."""
+        # 날짜 범위 (한 번만 계산)
+        date_min, date_max = data['date'].min(), data['date'].max()
+        earliest_date = date_min.strftime('%Y-%m-%d')
+        latest_date = date_max.strftime('%Y-%m-%d')
+        
         return {
             'total_days': len(data),
-            'date_range': f"{data['date'].min().strftime('%Y-%m-%d')} ~ {data['date'].max().strftime('%Y-%m-%d')}",
-            'days_covered': (data['date'].max() - data['date'].min()).days + 1,
+            'date_range': f"{earliest_date} ~ {latest_date}",
+            'days_covered': (date_max - date_min).days + 1,
             'data_completeness': len(data) / 30 * 100,  # 30일 기준 완성도
-            'latest_date': data['date'].max().strftime('%Y-%m-%d'),
-            'earliest_date': data['date'].min().strftime('%Y-%m-%d')
+            'latest_date': latest_date,
+            'earliest_date': earliest_date
         }
     
     def _analyze_temperature(self, data: pd.DataFrame) -> Dict:
@@ -60,9 +68,8 @@ class DataAnalyzer:
         stats = temp_data.describe()
         
         # 트렌드 분석
-        x_numeric = list(range(len(temp_data)))
         if len(temp_data) > 1:
-            slope = np.polyfit(x_numeric, temp_data, 1)[0]
+            slope, _ = linear_trend(temp_data)
             trend_direction = '상승' if slope > 0.1 else '하락' if slope < -0.1 else '안정'
             trend_strength = '강함' if abs(slope) > 0.5 else '보통' if abs(slope) > 0.2 else '약함'
         else:
@@ -70,20 +77,20 @@ class DataAnalyzer:
             trend_direction = '안정'
             trend_strength = '약함'
         
-        # 변동성 계산 (안전장치 추가)
-        temp_mean = temp_data.mean()
-        temp_std = temp_data.std()
+        # 변동성 계산 (안전장치 추가, describe() 결과 재사용)
+        temp_mean = stats['mean']
+        temp_std = stats['std']
         volatility = round(temp_std / temp_mean * 100, 1) if temp_mean != 0 and not np.isnan(temp_mean) else 0
         
         return {
-            'mean': round(temp_data.mean(), 1),
-            'std': round(temp_data.std(), 1),
-            'min': round(temp_data.min(), 1),
-            'max': round(temp_data.max(), 1),
-            'median': round(temp_data.median(), 1),
+            'mean': round(temp_mean, 1),
+            'std': round(temp_std, 1),
+            'min': round(stats['min'], 1),
+            'max': round(stats['max'], 1),
+            'median': round(stats['50%'], 1),
             'q25': round(stats['25%'], 1),
             'q75': round(stats['75%'], 1),
-            'range': round(temp_data.max() - temp_data.min(), 1),
+            'range': round(stats['max'] - stats['min'], 1),
             'trend_slope': round(slope, 3),
             'trend_direction': trend_direction,
             'trend_strength': trend_strength,
@@ -105,9 +112,8 @@ class DataAnalyzer:
         stats = humidity_data.describe()
         
         # 트렌드 분석
-        x_numeric = list(range(len(humidity_data)))
         if len(humidity_data) > 1:
-            slope = np.polyfit(x_numeric, humidity_data, 1)[0]
+            slope, _ = linear_trend(humidity_data)
             trend_direction = '상승' if slope > 0.5 else '하락' if slope < -0.5 else '안정'
             trend_strength = '강함' if abs(slope) > 2.0 else '보통' if abs(slope) > 1.0 else '약함'
         else:
@@ -115,20 +121,20 @@ class DataAnalyzer:
             trend_direction = '안정'
             trend_strength = '약함'
         
-        # 변동성 계산 (안전장치 추가)
-        humidity_mean = humidity_data.mean()
-        humidity_std = humidity_data.std()
+        # 변동성 계산 (안전장치 추가, describe() 결과 재사용)
+        humidity_mean = stats['mean']
+        humidity_std = stats['std']
         volatility = round(humidity_std / humidity_mean * 100, 1) if humidity_mean != 0 and not np.isnan(humidity_mean) else 0
         
         return {
-            'mean': round(humidity_data.mean(), 1),
-            'std': round(humidity_data.std(), 1),
-            'min': round(humidity_data.min(), 1),
-            'max': round(humidity_data.max(), 1),
-            'median': round(humidity_data.median(), 1),
+            'mean': round(humidity_mean, 1),
+            'std': round(humidity_std, 1),
+            'min': round(stats['min'], 1),
+            'max': round(stats['max'], 1),
+            'median': round(stats['50%'], 1),
             'q25': round(stats['25%'], 1),
             'q75': round(stats['75%'], 1),
-            'range': round(humidity_data.max() - humidity_data.min(), 1),
+            'range': round(stats['max'] - stats['min'], 1),
             'trend_slope': round(slope, 3),
             'trend_direction': trend_direction,
             'trend_strength': trend_strength,
@@ -138,17 +144,22 @@ class DataAnalyzer:
     def _analyze_monthly_patterns(self, data: pd.DataFrame) -> Dict:
         """월별 패턴을 분석합니다."""
         month_counts = data['month'].value_counts()
-        month_stats = {}
         
-        for month in data['month'].unique():
-            month_data = data[data['month'] == month]
+        # 월별 통계를 한 번의 groupby로 집계 (월마다 필터링하지 않음)
+        grouped = data.groupby('month', sort=False)
+        month_summary = grouped[['temperature', 'humidity']].agg(['mean', 'std']).round(1)
+        month_sizes = grouped.size()
+        
+        month_stats = {}
+        for month, count in month_sizes.items():
+            summary = month_summary.loc[month]
             month_stats[month] = {
-                'count': len(month_data),
-                'percentage': round(len(month_data) / len(data) * 100, 1),
-                'temp_mean': round(month_data['temperature'].mean(), 1),
-                'humidity_mean': round(month_data['humidity'].mean(), 1),
-                'temp_std': round(month_data['temperature'].std(), 1),
-                'humidity_std': round(month_data['humidity'].std(), 1)
+                'count': int(count),
+                'percentage': round(count / len(data) * 100, 1),
+                'temp_mean': summary[('temperature', 'mean')],
+                'humidity_mean': summary[('humidity', 'mean')],
+                'temp_std': summary[('temperature', 'std')],
+                'humidity_std': summary[('humidity', 'std')]
             }
         
         return {
@@ -196,15 +207,9 @@ class DataAnalyzer:
         if std == 0 or np.isnan(std) or std < 1e-10:
             return []
         
-        outliers = []
-        for i, value in enumerate(series):
-            if pd.isna(value):
-                continue
-            z_score = abs((value - mean) / std)
-            if z_score > threshold:
-                outliers.append(i)
-        
-        return outliers
+        # Z-점수를 배열 단위로 계산 (NaN은 비교 결과가 False이므로 자동 제외)
+        z_scores = np.abs((series.to_numpy(dtype=np.float64) - mean) / std)
+        return np.flatnonzero(z_scores > threshold).tolist()
     
     def _analyze_trends(self, data: pd.DataFrame) -> Dict:
         """트렌드 분석을 수행합니다."""
@@ -213,7 +218,7 @@ class DataAnalyzer:
         # 기온 트렌드
         temp_data = data['temperature'].values
         if len(temp_data) > 1:
-            temp_slope = np.polyfit(range(len(temp_data)), temp_data, 1)[0]
+            temp_slope, _ = linear_trend(temp_data)
             temp_r_squared = self._calculate_r_squared(temp_data)
             
             trends['temperature'] = {
@@ -227,7 +232,7 @@ class DataAnalyzer:
         # 습도 트렌드
         humidity_data = data['humidity'].values
         if len(humidity_data) > 1:
-            humidity_slope = np.polyfit(range(len(humidity_data)), humidity_data, 1)[0]
+            humidity_slope, _ = linear_trend(humidity_data)
             humidity_r_squared = self._calculate_r_squared(humidity_data)
             
             trends['humidity'] = {
@@ -246,7 +251,7 @@ class DataAnalyzer:
             return 0.0
         
         x = np.arange(len(data))
-        slope, intercept = np.polyfit(x, data, 1)
+        slope, intercept = linear_trend(data)
         y_pred = slope * x + intercept
         
         ss_res = np.sum((data - y_pred) ** 2)
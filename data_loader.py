@@ -5,11 +5,14 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import streamlit as st
 from typing import Optional, Dict, List
 import os
 
+from utils import build_fallback_frame, dataframe_fingerprint
+from weather_api import WeatherDataUnavailableError
+
 
 class DataLoader:
     """30일 데이터 로더 클래스"""
@@ -18,12 +21,26 @@ class DataLoader:
         self.weather_api = weather_api
         self.cache = {}
     
-    @st.cache_data
-    def load_30day_data(_self, city: str) -> pd.DataFrame:
+    def load_30day_data(self, city: str) -> pd.DataFrame:
         """최근 30일 기상 데이터를 로드합니다 (오늘 제외)."""
         
-        # 시작 날짜 계산 (오늘을 제외한 최근 30일)
+        # 종료 날짜(어제)를 캐시 키에 포함하여 날짜가 바뀌면 새로 가져오도록 함
         end_date = datetime.now() - timedelta(days=1)  # 어제까지 (오늘 제외)
+        try:
+            return self._load_30day_data(city, end_date.date())
+        except WeatherDataUnavailableError:
+            # 대체 데이터는 캐시하지 않음 (API가 복구되면 다음 로드에서 실제 데이터를 가져옴)
+            st.warning("⚠️ API에서 데이터를 가져올 수 없어 대체 데이터를 생성합니다.")
+            return self.clean_data(self._generate_fallback_data(city, 30))
+    
+    @st.cache_data(persist="disk", show_spinner=False, max_entries=32)
+    def _load_30day_data(_self, city: str, end_date: date) -> pd.DataFrame:
+        """지정한 종료일까지의 30일 데이터를 로드하고 정리합니다 (디스크에 캐시하여 서버 재시작 후에도 재사용).
+        
+        API 데이터가 없으면 캐시되지 않도록 WeatherDataUnavailableError를 발생시킵니다.
+        """
+        
+        # 시작 날짜 계산 (오늘을 제외한 최근 30일)
         start_date = end_date - timedelta(days=29)  # 30일 전부터
         
         st.info(f"📅 {start_date.strftime('%Y년 %m월 %d일')} ~ {end_date.strftime('%Y년 %m월 %d일')} (30일, 오늘 제외) 데이터를 가져옵니다.")
@@ -36,92 +53,23 @@ class DataLoader:
         )
         
         if historical_data.empty:
-            st.warning("⚠️ API에서 데이터를 가져올 수 없어 대체 데이터를 생성합니다.")
-            historical_data = _self._generate_fallback_data(city, 30)
+            raise WeatherDataUnavailableError(f"{city}의 30일 기상 데이터를 가져올 수 없습니다.")
         
-        return historical_data
+        _self.weather_api.render_summary(historical_data, city)
+        
+        # 정리된 결과를 캐시하여 재요청 시 정리 과정도 생략
+        return _self.clean_data(historical_data)
     
     def _generate_fallback_data(self, city: str, days: int) -> pd.DataFrame:
         """대체 데이터를 생성합니다 (오늘 제외)."""
         
         st.info(f"📊 {city}의 최근 {days}일 대체 데이터를 생성합니다 (오늘 제외)...")
         
-        all_data = []
-        end_date = datetime.now() - timedelta(days=1)  # 어제까지 (오늘 제외)
+        # 어제부터 과거 방향으로 (오늘 제외)
+        end_date = datetime.now() - timedelta(days=1)
+        dates = pd.date_range(end=end_date, periods=days, freq='D')[::-1]
         
-        for i in range(days):
-            current_date = end_date - timedelta(days=i)
-            month = current_date.month
-            
-            # 월별 기본 기상 특성
-            if month in [3, 4, 5]:
-                base_temp = 15
-                base_humidity = 55
-                temp_variation = 8
-                humidity_variation = 15
-            elif month in [6, 7, 8]:
-                base_temp = 25
-                base_humidity = 70
-                temp_variation = 6
-                humidity_variation = 20
-            elif month in [9, 10, 11]:
-                base_temp = 18
-                base_humidity = 60
-                temp_variation = 7
-                humidity_variation = 15
-            else:
-                base_temp = 2
-                base_humidity = 50
-                temp_variation = 6
-                humidity_variation = 20
-            
-            # 도시별 기후 특성 반영
-            city_modifiers = {
-                "서울": {"temp": 0, "humidity": 0},
-                "부산": {"temp": 2, "humidity": 10},
-                "대구": {"temp": 1, "humidity": -5},
-                "인천": {"temp": -1, "humidity": 5},
-                "광주": {"temp": 1, "humidity": 5},
-                "대전": {"temp": 0, "humidity": 0},
-                "울산": {"temp": 1, "humidity": 5},
-                "제주": {"temp": 3, "humidity": 15}
-            }
-            
-            modifier = city_modifiers.get(city, {"temp": 0, "humidity": 0})
-            
-            # 평균 기온과 습도 생성 (정규분포 기반)
-            avg_temperature = base_temp + modifier["temp"] + np.random.normal(0, temp_variation)
-            avg_humidity = base_humidity + modifier["humidity"] + np.random.normal(0, humidity_variation)
-            
-            # 최고/최저 기온 생성 (평균 기온 기준으로 변동)
-            temp_range = temp_variation * 1.5
-            max_temperature = avg_temperature + np.random.uniform(0, temp_range)
-            min_temperature = avg_temperature - np.random.uniform(0, temp_range)
-            
-            # 값 범위 제한
-            avg_temperature = max(-20, min(40, avg_temperature))
-            max_temperature = max(-20, min(40, max_temperature))
-            min_temperature = max(-20, min(40, min_temperature))
-            avg_humidity = max(0, min(100, avg_humidity))
-            
-            # 최고/최저 기온이 평균 기온보다 적절한 순서가 되도록 조정
-            if max_temperature < avg_temperature:
-                max_temperature = avg_temperature + np.random.uniform(1, 5)
-            if min_temperature > avg_temperature:
-                min_temperature = avg_temperature - np.random.uniform(1, 5)
-            
-            all_data.append({
-                'date': current_date,
-                'city': city,
-                'temperature': round(avg_temperature, 1),  # 평균 기온
-                'temp_max': round(max_temperature, 1),     # 최고 기온
-                'temp_min': round(min_temperature, 1),     # 최저 기온
-                'humidity': round(avg_humidity, 1),        # 평균 습도
-                'month': month,
-                'year': current_date.year
-            })
-        
-        df = pd.DataFrame(all_data)
+        df = build_fallback_frame(city, dates)
         st.success(f"✅ {city}의 최근 {days}일 대체 데이터 생성 완료 ({len(df)}개 데이터, 오늘 제외)")
         
         return df
@@ -151,94 +99,22 @@ class DataLoader:
             st.warning("⚠️ API에서 데이터를 가져올 수 없어 대체 데이터를 생성합니다.")
             days = (end_date - start_date).days + 1
             historical_data = self._generate_fallback_data_for_range(city, start_date, end_date)
+        else:
+            self.weather_api.render_summary(historical_data, city)
         
         return historical_data
     
     def _generate_fallback_data_for_range(self, city: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """특정 범위의 대체 데이터를 생성합니다."""
         
-        all_data = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            month = current_date.month
-            
-            # 월별 기본 기상 특성
-            if month in [3, 4, 5]:
-                base_temp = 15
-                base_humidity = 55
-                temp_variation = 8
-                humidity_variation = 15
-            elif month in [6, 7, 8]:
-                base_temp = 25
-                base_humidity = 70
-                temp_variation = 6
-                humidity_variation = 20
-            elif month in [9, 10, 11]:
-                base_temp = 18
-                base_humidity = 60
-                temp_variation = 7
-                humidity_variation = 15
-            else:
-                base_temp = 2
-                base_humidity = 50
-                temp_variation = 6
-                humidity_variation = 20
-            
-            # 도시별 기후 특성 반영
-            city_modifiers = {
-                "서울": {"temp": 0, "humidity": 0},
-                "부산": {"temp": 2, "humidity": 10},
-                "대구": {"temp": 1, "humidity": -5},
-                "인천": {"temp": -1, "humidity": 5},
-                "광주": {"temp": 1, "humidity": 5},
-                "대전": {"temp": 0, "humidity": 0},
-                "울산": {"temp": 1, "humidity": 5},
-                "제주": {"temp": 3, "humidity": 15}
-            }
-            
-            modifier = city_modifiers.get(city, {"temp": 0, "humidity": 0})
-            
-            # 평균 기온과 습도 생성 (정규분포 기반)
-            avg_temperature = base_temp + modifier["temp"] + np.random.normal(0, temp_variation)
-            avg_humidity = base_humidity + modifier["humidity"] + np.random.normal(0, humidity_variation)
-            
-            # 최고/최저 기온 생성 (평균 기온 기준으로 변동)
-            temp_range = temp_variation * 1.5
-            max_temperature = avg_temperature + np.random.uniform(0, temp_range)
-            min_temperature = avg_temperature - np.random.uniform(0, temp_range)
-            
-            # 값 범위 제한
-            avg_temperature = max(-20, min(40, avg_temperature))
-            max_temperature = max(-20, min(40, max_temperature))
-            min_temperature = max(-20, min(40, min_temperature))
-            avg_humidity = max(0, min(100, avg_humidity))
-            
-            # 최고/최저 기온이 평균 기온보다 적절한 순서가 되도록 조정
-            if max_temperature < avg_temperature:
-                max_temperature = avg_temperature + np.random.uniform(1, 5)
-            if min_temperature > avg_temperature:
-                min_temperature = avg_temperature - np.random.uniform(1, 5)
-            
-            all_data.append({
-                'date': current_date,
-                'city': city,
-                'temperature': round(avg_temperature, 1),  # 평균 기온
-                'temp_max': round(max_temperature, 1),     # 최고 기온
-                'temp_min': round(min_temperature, 1),     # 최저 기온
-                'humidity': round(avg_humidity, 1),        # 평균 습도
-                'month': month,
-                'year': current_date.year
-            })
-            
-            current_date += timedelta(days=1)
-        
-        df = pd.DataFrame(all_data)
+        dates = pd.date_range(start_date, end_date, freq='D')
+        df = build_fallback_frame(city, dates)
         st.success(f"✅ {city}의 {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')} 대체 데이터 생성 완료 ({len(df)}개 데이터)")
         
         return df
     
-    def get_data_info(self, data: pd.DataFrame) -> Dict:
+    @st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def get_data_info(_self, data: pd.DataFrame) -> Dict:
         """데이터 정보를 반환합니다."""
         if data.empty:
             return {}
@@ -253,10 +129,13 @@ class DataLoader:
         # 습도 정보
         humidity_info = f"{data['humidity'].min():.1f}% ~ {data['humidity'].max():.1f}%"
         
+        # 날짜 범위 (한 번만 계산)
+        date_min, date_max = data['date'].min(), data['date'].max()
+        
         return {
             'total_records': len(data),
-            'date_range': f"{data['date'].min().strftime('%Y-%m-%d')} ~ {data['date'].max().strftime('%Y-%m-%d')}",
-            'days_covered': (data['date'].max() - data['date'].min()).days + 1,
+            'date_range': f"{date_min.strftime('%Y-%m-%d')} ~ {date_max.strftime('%Y-%m-%d')}",
+            'days_covered': (date_max - date_min).days + 1,
             'city': data['city'].iloc[0] if len(data) > 0 else '',
             'temperature_range': temp_info,
             'humidity_range': humidity_info,
@@ -316,6 +195,10 @@ class DataLoader:
         if data.empty:
             return data
         
+        # 날짜를 datetime64로 통일 (파이썬 datetime 객체 열 방지)
+        if not pd.api.types.is_datetime64_any_dtype(data['date']):
+            data = data.assign(date=pd.to_datetime(data['date']))
+        
         # 날짜 순서로 정렬
         data = data.sort_values('date').reset_index(drop=True)
         
@@ -333,6 +216,18 @@ class DataLoader:
         if 'month' not in data.columns:
             data['month'] = data['date'].dt.month
         
+        # 자료형 축소 (캐시 크기와 후속 연산 메모리 절감)
+        downcast_dtypes = {
+            'temperature': 'float32',
+            'temp_max': 'float32',
+            'temp_min': 'float32',
+            'humidity': 'float32',
+            'month': 'int8',
+            'year': 'int16',
+            'city': 'category'
+        }
+        data = data.astype({col: dtype for col, dtype in downcast_dtypes.items() if col in data.columns})
+        
         return data
     
  
\ No newline at end of file
@@ -7,6 +7,30 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 
+# 위험 수준 분류 경계 (사망률이 경계값 미만이면 해당 수준, 마지막 경계 이상은 '매우 높음')
+RISK_LEVEL_THRESHOLDS = np.array([3.0, 5.0, 8.0])
+RISK_LEVEL_LABELS = np.array(["낮음", "보통", "높음", "매우 높음"])
+
+
+def _mortality_kernel(base_rate: float, *risk_factors) -> tuple:
+    """위험도 요인(배열 또는 스칼라)을 곱해 종합 위험도, 사망률, 95% 신뢰구간을 계산합니다.
+    
+    첫 번째 요인은 배열이어야 하며, 곱셈은 하나의 출력 배열에서 제자리로 수행합니다.
+    """
+    total_risk = np.array(risk_factors[0], dtype=np.float64)
+    for risk in risk_factors[1:]:
+        np.multiply(total_risk, risk, out=total_risk)
+    
+    # 사망률 계산 (10만명당)
+    mortality_rate = total_risk * base_rate
+    
+    # 95% 신뢰구간 계산
+    confidence_interval = mortality_rate * 0.2  # ±20%
+    lower_bound = np.maximum(0, mortality_rate - confidence_interval)
+    upper_bound = mortality_rate + confidence_interval
+    
+    return total_risk, mortality_rate, lower_bound, upper_bound
+
 
 class MortalityCalculator:
     """사망률 계산 클래스"""
@@ -78,6 +102,11 @@ class MortalityCalculator:
         
         # 기본 사망률 (10만명당)
         self.base_mortality_rate = 5.0
+        
+        # 월별 위험도 조회표 (인덱스 = 월, 0번은 사용하지 않음)
+        self.temporal_risk_table = np.array(
+            [1.0] + [self.risk_factors["temporal_risk"].get(month, 1.0) for month in range(1, 13)]
+        )
     
     def calculate_temperature_risk(self, temperature: float) -> float:
         """온도 기반 위험도를 계산합니다."""
@@ -127,56 +156,119 @@ class MortalityCalculator:
         """시간적 위험도를 계산합니다."""
         return self.risk_factors["temporal_risk"].get(month, 1.0)
     
-    def calculate_mortality_rate(self, weather_data: dict, age_group: str = "전체", 
-                               gender: str = "전체") -> dict:
-        """종합적인 사망률을 계산합니다."""
+    def calculate_temperature_risk_array(self, temperature: np.ndarray) -> np.ndarray:
+        """온도 기반 위험도를 배열 단위로 계산합니다."""
+        temp_risk = self.risk_factors["temp_risk"]
         
-        if not weather_data:
-            return None
+        return np.select(
+            [temperature < temp_risk["cold_threshold"], temperature > temp_risk["heat_threshold"]],
+            [
+                np.minimum(1 + (temp_risk["cold_threshold"] - temperature) * 0.1, temp_risk["cold_risk_factor"]),
+                np.minimum(1 + (temperature - temp_risk["heat_threshold"]) * 0.15, temp_risk["heat_risk_factor"])
+            ],
+            default=1.0
+        )
+    
+    def calculate_humidity_risk_array(self, humidity: np.ndarray) -> np.ndarray:
+        """습도 기반 위험도를 배열 단위로 계산합니다."""
+        humidity_risk = self.risk_factors["humidity_risk"]
+        
+        return np.select(
+            [humidity < humidity_risk["low_threshold"], humidity > humidity_risk["high_threshold"]],
+            [
+                np.minimum(1 + (humidity_risk["low_threshold"] - humidity) * 0.01, humidity_risk["low_risk_factor"]),
+                np.minimum(1 + (humidity - humidity_risk["high_threshold"]) * 0.01, humidity_risk["high_risk_factor"])
+            ],
+            default=1.0
+        )
+    
+    def _lookup_regional_risk(self, cities: pd.Series) -> np.ndarray:
+        """도시 열을 고유값 단위로 조회하여 지역 위험도 배열을 만듭니다."""
+        codes, uniques = pd.factorize(cities)
+        
+        # 결측 도시(-1 코드)는 마지막 자리의 기본값 1.0을 사용
+        table = np.array([self.calculate_regional_risk(city) for city in uniques] + [1.0])
+        return table[codes]
+    
+    def _calculate_mortality_arrays(self, temperature: np.ndarray, humidity: np.ndarray,
+                                    regional_risk: np.ndarray, months: np.ndarray,
+                                    age_group: str, gender: str) -> dict:
+        """배열 입력으로 위험도 요인과 사망률을 계산합니다."""
         
         # 각 위험도 계산
-        temp_risk = self.calculate_temperature_risk(weather_data['temperature'])
-        humidity_risk = self.calculate_humidity_risk(weather_data['humidity'])
-        regional_risk = self.calculate_regional_risk(weather_data['city'])
+        temp_risk = self.calculate_temperature_risk_array(temperature)
+        humidity_risk = self.calculate_humidity_risk_array(humidity)
         age_risk = self.calculate_age_risk(age_group)
         gender_risk = self.calculate_gender_risk(gender)
-        temporal_risk = self.calculate_temporal_risk(weather_data['date'].month)
+        temporal_risk = self.temporal_risk_table[months]
         
         # 종합 위험도 계산 (곱셈 모델)
-        total_risk = (temp_risk * humidity_risk * regional_risk * 
-                     age_risk * gender_risk * temporal_risk)
-        
-        # 사망률 계산 (10만명당)
-        mortality_rate = self.base_mortality_rate * total_risk
-        
-        # 95% 신뢰구간 계산
-        confidence_interval = mortality_rate * 0.2  # ±20%
-        lower_bound = max(0, mortality_rate - confidence_interval)
-        upper_bound = mortality_rate + confidence_interval
-        
-        # 위험 수준 분류
-        if mortality_rate < 3:
-            risk_level = "낮음"
-        elif mortality_rate < 5:
-            risk_level = "보통"
-        elif mortality_rate < 8:
-            risk_level = "높음"
-        else:
-            risk_level = "매우 높음"
+        total_risk, mortality_rate, lower_bound, upper_bound = _mortality_kernel(
+            self.base_mortality_rate,
+            temp_risk, humidity_risk, regional_risk, age_risk, gender_risk, temporal_risk
+        )
+        
+        # 위험 수준 분류 (경계값 이진 탐색으로 구간 인덱스를 구해 라벨 조회)
+        risk_level = RISK_LEVEL_LABELS[np.searchsorted(RISK_LEVEL_THRESHOLDS, mortality_rate, side='right')]
         
         return {
-            'mortality_rate': round(mortality_rate, 2),
-            'lower_bound': round(lower_bound, 2),
-            'upper_bound': round(upper_bound, 2),
+            'mortality_rate': mortality_rate.round(2),
+            'lower_bound': lower_bound.round(2),
+            'upper_bound': upper_bound.round(2),
             'risk_level': risk_level,
+            'temperature_risk': temp_risk.round(3),
+            'humidity_risk': humidity_risk.round(3),
+            'regional_risk': regional_risk.round(3),
+            'age_risk': round(age_risk, 3),
+            'gender_risk': round(gender_risk, 3),
+            'temporal_risk': temporal_risk.round(3),
+            'total_risk': total_risk.round(3)
+        }
+    
+    def calculate_mortality_frame(self, weather_data: pd.DataFrame, age_group: str = "전체", 
+                                gender: str = "전체") -> pd.DataFrame:
+        """여러 날짜의 사망률과 위험도 요인을 한 번에 (열 단위로) 계산합니다."""
+        
+        dates = pd.DatetimeIndex(weather_data['date'])
+        result = self._calculate_mortality_arrays(
+            weather_data['temperature'].to_numpy(dtype=np.float64),
+            weather_data['humidity'].to_numpy(dtype=np.float64),
+            self._lookup_regional_risk(weather_data['city']),
+            dates.month.to_numpy(),
+            age_group, gender
+        )
+        
+        return pd.DataFrame({'date': dates, **result})
+    
+    def calculate_mortality_rate(self, weather_data: dict, age_group: str = "전체", 
+                               gender: str = "전체") -> dict:
+        """종합적인 사망률을 계산합니다."""
+        
+        if not weather_data:
+            return None
+        
+        # 길이 1 배열로 배열 계산을 공유 (데이터프레임 생성 없이)
+        result = self._calculate_mortality_arrays(
+            np.array([weather_data['temperature']], dtype=np.float64),
+            np.array([weather_data['humidity']], dtype=np.float64),
+            np.array([self.calculate_regional_risk(weather_data.get('city'))]),
+            np.array([pd.Timestamp(weather_data['date']).month]),
+            age_group, gender
+        )
+        
+        return {
+            'mortality_rate': float(result['mortality_rate'][0]),
+            'lower_bound': float(result['lower_bound'][0]),
+            'upper_bound': float(result['upper_bound'][0]),
+            'risk_level': str(result['risk_level'][0]),
             'risk_factors': {
-                'temperature_risk': round(temp_risk, 3),
-                'humidity_risk': round(humidity_risk, 3),
-                'regional_risk': round(regional_risk, 3),
-                'age_risk': round(age_risk, 3),
-                'gender_risk': round(gender_risk, 3),
-                'temporal_risk': round(temporal_risk, 3),
-                'total_risk': round(total_risk, 3)
+                'temperature_risk': float(result['temperature_risk'][0]),
+                'humidity_risk': float(result['humidity_risk'][0]),
+                'regional_risk': float(result['regional_risk'][0]),
+                'age_risk': float(result['age_risk']),
+                'gender_risk': float(result['gender_risk']),
+                'temporal_risk': float(result['temporal_risk'][0]),
+                'total_risk': float(result['total_risk'][0])
             }
         }
     
@@ -187,25 +279,12 @@ class MortalityCalculator:
         if weather_data.empty:
             return pd.DataFrame()
         
-        mortality_data = []
+        mortality_frame = self.calculate_mortality_frame(weather_data, age_group, gender)
         
-        for _, row in weather_data.iterrows():
-            weather_dict = {
-                'date': row['date'],
-                'city': row['city'],
-                'temperature': row['temperature'],
-                'humidity': row['humidity']
-            }
-            
-            mortality_result = self.calculate_mortality_rate(weather_dict, age_group, gender)
-            
-            if mortality_result:
-                mortality_data.append({
-                    'date': row['date'],
-                    'mortality_rate': mortality_result['mortality_rate'],
-                    'risk_level': mortality_result['risk_level'],
-                    'temperature': row['temperature'],
-                    'humidity': row['humidity']
-                })
-        
-        return pd.DataFrame(mortality_data) 
\ No newline at end of file
+        return pd.DataFrame({
+            'date': mortality_frame['date'],
+            'mortality_rate': mortality_frame['mortality_rate'],
+            'risk_level': mortality_frame['risk_level'],
+            'temperature': weather_data['temperature'].to_numpy(),
+            'humidity': weather_data['humidity'].to_numpy()
+        })
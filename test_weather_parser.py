@@ -0,0 +1,45 @@
+"""
+기상청 텍스트 응답 파서 테스트
+잘못된 행이 있어도 해당 행만 건너뛰고 나머지 데이터는 파싱하는지 확인합니다.
+"""
+
+from weather_api import WeatherAPI
+
+HEADER = b"# YYMMDD STN WS_AVG TA HM"
+END = b"#7777END"
+
+
+def _parse(data_lines):
+    """헤더/종료 표시를 붙여 텍스트 응답을 파싱합니다 (메시지 출력 생략)."""
+    # 파서는 인스턴스 상태를 쓰지 않으므로 HTTP 세션/디스크 캐시를 만들지 않고 호출
+    api = WeatherAPI.__new__(WeatherAPI)
+    return api._parse_text_response([HEADER, *data_lines, END], "서울", quiet=True)
+
+
+def test_non_numeric_value_skips_row():
+    """숫자가 아닌 기온 값(xx)이 있는 행만 제외합니다."""
+    df = _parse([
+        b"20240101 108 1.5 2.1 55.0",
+        b"20240102 108 1.2 xx 60.0",
+        b"20240103 108 0.8 -1.4 48.0",
+    ])
+    assert df['date'].dt.strftime('%Y%m%d').tolist() == ['20240101', '20240103']
+    assert df['temperature'].astype(float).round(1).tolist() == [2.1, -1.4]
+
+
+def test_short_first_row_skips_row():
+    """첫 데이터 행의 필드가 부족해도 그 행만 제외하고 나머지 행은 올바른 컬럼에서 읽습니다."""
+    df = _parse([
+        b"20240101 108 2.1",
+        b"20240102 108 1.2 3.4 60.0",
+        b"20240103 108 0.8 -1.4 48.0",
+    ])
+    assert df['date'].dt.strftime('%Y%m%d').tolist() == ['20240102', '20240103']
+    assert df['temperature'].astype(float).round(1).tolist() == [3.4, -1.4]
+    assert df['humidity'].astype(float).round(1).tolist() == [60.0, 48.0]
+
+
+if __name__ == "__main__":
+    test_non_numeric_value_skips_row()
+    test_short_first_row_skips_row()
+    print("✅ 텍스트 응답 파서 테스트 통과")
@@ -3,11 +3,41 @@ UI 컴포넌트 모듈
 Streamlit UI 컴포넌트들을 담당합니다.
 """
 
+import html
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+# 사이드바 선택지 (정적 목록이므로 모듈 로드 시 한 번만 생성)
+CITY_OPTIONS = ("서울", "부산", "대구", "인천", "광주", "대전", "울산", "제주")
+AGE_GROUP_OPTIONS = ("20-29세", "30-39세", "40-49세", "50-59세", "60-69세", "70세 이상")
+GENDER_OPTIONS = ("남성", "여성")
+
+# 기온별 추천 복장 (경계값 이상이면 다음 구간, np.digitize로 구간 인덱스 계산)
+OUTFIT_TEMP_BINS = np.array([12, 18, 23, 28])
+OUTFIT_BY_TEMP = (
+    ("🧥 패딩", "🧤 장갑", "두꺼운 겨울 복장"),
+    ("🧥 코트", "🧣 목도리", "따뜻한 겨울 복장"),
+    ("🧥 얇은 가디건", "👖 긴바지", "적당한 겉옷 필요"),
+    ("👔 얇은 셔츠", "👖 얇은 바지", "가벼운 봄/가을 복장"),
+    ("👕 반팔티", "🩳 반바지", "시원한 여름 복장"),
+)
+
+# 카드/복장 표시에 쓰는 공통 CSS (요소마다 인라인 스타일을 반복하지 않도록 클래스로 정의)
+UI_STYLES = """
+<style>
+.metric-row { display: flex; flex-wrap: wrap; gap: 1rem; margin-bottom: 1rem; }
+.metric-card { flex: 1 1 0; min-width: 8rem; }
+.metric-title { font-size: 0.875rem; opacity: 0.7; }
+.metric-value { font-size: 2rem; line-height: 1.4; }
+.metric-caption { font-size: 0.8rem; opacity: 0.6; }
+.outfit-item { text-align: left; font-size: 20px; margin: 2px 0; line-height: 1.2; padding: 0 2px; }
+.outfit-extra { color: #666; }
+</style>
+"""
 
 class UIComponents:
     """UI 컴포넌트 클래스"""
@@ -21,39 +51,51 @@ class UIComponents:
             'info': '#17a2b8'
         }
     
+    def inject_styles(self):
+        """공통 CSS 클래스를 페이지에 한 번 주입합니다."""
+        st.markdown(UI_STYLES, unsafe_allow_html=True)
+    
     def create_sidebar(self, weather_api):
         """사이드바를 생성합니다."""
         with st.sidebar:
             st.header("⚙️ 설정")
             
-            # 도시 선택
-            cities = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "제주"]
-            selected_city = st.selectbox("🏙️ 도시 선택", cities, index=0)
-            
-            # 연령대 선택
-            age_groups = ["20-29세", "30-39세", "40-49세", "50-59세", "60-69세", "70세 이상"]
-            selected_age_group = st.selectbox("👥 연령대 선택", age_groups, index=2)
-            
-            # 성별 선택
-            genders = ["남성", "여성"]
-            selected_gender = st.selectbox("👤 성별 선택", genders, index=0)
-            
-            # 예측 날짜 설정
-            st.subheader("📅 예측 설정")
-            today = datetime.now().date()
-            max_date = today + timedelta(days=30)
-            prediction_date = st.date_input(
-                "🔮 예측 날짜",
-                value=today + timedelta(days=7),
-                min_value=today + timedelta(days=1),
-                max_value=max_date
-            )
+            # 설정 변경은 폼 제출 시에만 반영 (위젯 조작마다 전체 재실행 방지)
+            with st.form('settings_form'):
+                # 도시 선택
+                selected_city = st.selectbox("🏙️ 도시 선택", CITY_OPTIONS, index=0)
+                
+                # 연령대 선택
+                selected_age_group = st.selectbox("👥 연령대 선택", AGE_GROUP_OPTIONS, index=2)
+                
+                # 성별 선택
+                selected_gender = st.selectbox("👤 성별 선택", GENDER_OPTIONS, index=0)
+                
+                # 예측 날짜 설정 (오늘 날짜는 재실행마다 한 번만 조회하여 공유)
+                st.subheader("📅 예측 설정")
+                today = datetime.now().date()
+                max_date = today + timedelta(days=30)
+                prediction_date = st.date_input(
+                    "🔮 예측 날짜",
+                    value=today + timedelta(days=7),
+                    min_value=today + timedelta(days=1),
+                    max_value=max_date
+                )
+                
+                st.form_submit_button("✅ 설정 적용", use_container_width=True)
+                
+                # 분석 시작도 폼 제출로 처리 (적용하지 않은 설정으로 분석되는 일 방지)
+                start_analysis = st.form_submit_button(
+                    "📊 30일 기상 데이터 분석 시작", type="primary", use_container_width=True
+                )
             
             return {
                 'selected_city': selected_city,
                 'selected_age_group': selected_age_group,
                 'selected_gender': selected_gender,
-                'prediction_date': prediction_date
+                'prediction_date': prediction_date,
+                'today': today,
+                'start_analysis': start_analysis
             }
     
     def display_data_info(self, data_info: Dict):
@@ -63,27 +105,21 @@ class UIComponents:
         
         st.subheader("📊 데이터 정보")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("총 데이터 수", data_info.get('total_records', 0))
-        
-        with col2:
-            st.metric("기간", data_info.get('days_covered', 0))
-        
-        with col3:
-            completeness = "완전" if data_info.get('is_complete_30days', False) else "불완전"
-            st.metric("30일 완성도", completeness)
-        
-        with col4:
-            missing = data_info.get('missing_days', 0)
-            st.metric("누락 일수", missing)
+        completeness = "완전" if data_info.get('is_complete_30days', False) else "불완전"
+        self.create_metric_row([
+            ("총 데이터 수", data_info.get('total_records', 0)),
+            ("기간", data_info.get('days_covered', 0)),
+            ("30일 완성도", completeness),
+            ("누락 일수", data_info.get('missing_days', 0))
+        ])
         
-        # 상세 정보
-        st.info(f"📅 **기간**: {data_info.get('date_range', 'N/A')}")
-        st.info(f"🌍 **지역**: {data_info.get('city', 'N/A')}")
-        st.info(f"🌡️ **기온 범위**: {data_info.get('temperature_range', 'N/A')}")
-        st.info(f"💧 **습도 범위**: {data_info.get('humidity_range', 'N/A')}")
+        # 상세 정보 (한 번의 메시지로 묶어 표시)
+        st.info("  \n".join((
+            f"📅 **기간**: {data_info.get('date_range', 'N/A')}",
+            f"🌍 **지역**: {data_info.get('city', 'N/A')}",
+            f"🌡️ **기온 범위**: {data_info.get('temperature_range', 'N/A')}",
+            f"💧 **습도 범위**: {data_info.get('humidity_range', 'N/A')}"
+        )))
     
     def display_analysis_summary(self, analysis: Dict):
         """분석 요약을 표시합니다."""
@@ -94,129 +130,82 @@ class UIComponents:
         
         # 기본 정보
         basic_info = analysis.get('basic_info', {})
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("총 데이터 수", basic_info.get('total_days', 0))
-        
-        with col2:
-            st.metric("데이터 완성도", f"{basic_info.get('data_completeness', 0):.1f}%")
-        
-        with col3:
-            outliers = analysis.get('outlier_analysis', {}).get('total_outliers', 0)
-            st.metric("이상치 수", outliers)
+        outliers = analysis.get('outlier_analysis', {}).get('total_outliers', 0)
+        self.create_metric_row([
+            ("총 데이터 수", basic_info.get('total_days', 0)),
+            ("데이터 완성도", f"{basic_info.get('data_completeness', 0):.1f}%"),
+            ("이상치 수", outliers)
+        ])
         
         # 기온 분석
         temp_analysis = analysis.get('temperature_analysis', {})
         st.subheader("🌡️ 기온 분석")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("평균 기온", f"{temp_analysis.get('mean', 0)}°C")
-        
-        with col2:
-            st.metric("최고 기온", f"{temp_analysis.get('max', 0)}°C")
-        
-        with col3:
-            st.metric("최저 기온", f"{temp_analysis.get('min', 0)}°C")
-        
-        with col4:
-            st.metric("변동성", f"{temp_analysis.get('volatility', 0)}%")
+        self.create_metric_row([
+            ("평균 기온", f"{temp_analysis.get('mean', 0)}°C"),
+            ("최고 기온", f"{temp_analysis.get('max', 0)}°C"),
+            ("최저 기온", f"{temp_analysis.get('min', 0)}°C"),
+            ("변동성", f"{temp_analysis.get('volatility', 0)}%")
+        ])
         
         # 습도 분석
         humidity_analysis = analysis.get('humidity_analysis', {})
         st.subheader("💧 습도 분석")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("평균 습도", f"{humidity_analysis.get('mean', 0)}%")
-        
-        with col2:
-            st.metric("최고 습도", f"{humidity_analysis.get('max', 0)}%")
-        
-        with col3:
-            st.metric("최저 습도", f"{humidity_analysis.get('min', 0)}%")
-        
-        with col4:
-            st.metric("변동성", f"{humidity_analysis.get('volatility', 0)}%")
+        self.create_metric_row([
+            ("평균 습도", f"{humidity_analysis.get('mean', 0)}%"),
+            ("최고 습도", f"{humidity_analysis.get('max', 0)}%"),
+            ("최저 습도", f"{humidity_analysis.get('min', 0)}%"),
+            ("변동성", f"{humidity_analysis.get('volatility', 0)}%")
+        ])
         
         # 트렌드 분석
         trends = analysis.get('trend_analysis', {})
         st.subheader("📈 트렌드 분석")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            temp_trend = trends.get('temperature', {})
-            st.metric("기온 트렌드", temp_trend.get('direction', 'N/A'))
-            st.caption(f"강도: {temp_trend.get('strength', 'N/A')}")
-        
-        with col2:
-            humidity_trend = trends.get('humidity', {})
-            st.metric("습도 트렌드", humidity_trend.get('direction', 'N/A'))
-            st.caption(f"강도: {humidity_trend.get('strength', 'N/A')}")
+        temp_trend = trends.get('temperature', {})
+        humidity_trend = trends.get('humidity', {})
+        self.create_metric_row([
+            ("기온 트렌드", temp_trend.get('direction', 'N/A'), f"강도: {temp_trend.get('strength', 'N/A')}"),
+            ("습도 트렌드", humidity_trend.get('direction', 'N/A'), f"강도: {humidity_trend.get('strength', 'N/A')}")
+        ])
     
-    def display_prediction_results(self, weather_predictions, mortality_result, selected_city, target_prediction_date=None):
+    def display_prediction_results(self, weather_predictions, mortality_result, selected_city, target_prediction_date=None,
+                                   last_weather=None):
         """예측 결과를 표시합니다."""
         if weather_predictions.empty:
             return
         
+        # 마지막 예측 행 (세션 상태에 보관된 값이 있으면 재사용)
+        last = last_weather or {
+            'date': weather_predictions['date'].iat[-1],
+            'temperature': float(weather_predictions['temperature'].iat[-1]),
+            'humidity': float(weather_predictions['humidity'].iat[-1])
+        }
+        temp = last['temperature']
+        humidity = last['humidity']
+        
         # 예측 날짜 (사용자가 설정한 날짜 또는 마지막 예측 날짜)
         if target_prediction_date:
             prediction_date = target_prediction_date
         else:
-            prediction_date = weather_predictions.iloc[-1]['date']
+            prediction_date = last['date']
         
         st.success(f"✅ {prediction_date.strftime('%Y년 %m월 %d일')} 예측 완료 (30일 데이터 기반)")
         
-        # 예측 결과 표시
-        col1, col2, col3, col4 = st.columns(4)
+        # 예측 결과 표시 (기온/습도/날짜는 한 번의 HTML 행으로, 추천 복장은 도움말이 있어 별도 열로 표시)
+        metrics_col, outfit_col = st.columns([3, 1])
         
-        with col1:
-            st.metric(
-                "예측 기온",
-                f"{weather_predictions.iloc[-1]['temperature']:.1f}°C"
-            )
-        
-        with col2:
-            st.metric(
-                "예측 습도",
-                f"{weather_predictions.iloc[-1]['humidity']:.1f}%"
-            )
+        with metrics_col:
+            self.create_metric_row([
+                ("예측 기온", f"{temp:.1f}°C"),
+                ("예측 습도", f"{humidity:.1f}%"),
+                ("예측 날짜", prediction_date.strftime('%m월 %d일'))
+            ])
         
-        with col3:
-            st.metric(
-                "예측 날짜",
-                prediction_date.strftime('%m월 %d일')
-            )
-        
-        with col4:
+        with outfit_col:
             # 날씨별 추천 옷
-            temp = weather_predictions.iloc[-1]['temperature']
-            humidity = weather_predictions.iloc[-1]['humidity']
-            
-            if temp >= 28:
-                outfit_main = "👕 반팔티"
-                outfit_sub = "🩳 반바지"
-                outfit_desc = "시원한 여름 복장"
-            elif temp >= 23:
-                outfit_main = "👔 얇은 셔츠"
-                outfit_sub = "👖 얇은 바지"
-                outfit_desc = "가벼운 봄/가을 복장"
-            elif temp >= 18:
-                outfit_main = "🧥 얇은 가디건"
-                outfit_sub = "👖 긴바지"
-                outfit_desc = "적당한 겉옷 필요"
-            elif temp >= 12:
-                outfit_main = "🧥 코트"
-                outfit_sub = "🧣 목도리"
-                outfit_desc = "따뜻한 겨울 복장"
-            else:
-                outfit_main = "🧥 패딩"
-                outfit_sub = "🧤 장갑"
-                outfit_desc = "두꺼운 겨울 복장"
+            outfit_main, outfit_sub, outfit_desc = OUTFIT_BY_TEMP[int(np.digitize(temp, OUTFIT_TEMP_BINS))]
             
             # 습도에 따른 추가 조언
             extra_item = ""
@@ -231,44 +220,22 @@ class UIComponents:
             # 추천 복장 표시 (폰트 크기 통일)
             st.markdown("**추천 복장**", help=f"{outfit_desc}{extra_desc}")
             
-            # 메인 복장과 서브 복장을 세로로 배치 (왼쪽 정렬)
-            st.markdown(f"<div style='text-align: left; font-size: 20px; margin: 2px 0; line-height: 1.2; padding: 0 2px;'>{outfit_main}</div>", unsafe_allow_html=True)
-            st.markdown(f"<div style='text-align: left; font-size: 20px; margin: 2px 0; line-height: 1.2; padding: 0 2px;'>{outfit_sub}</div>", unsafe_allow_html=True)
-            
-            # 추가 아이템이 있으면 표시
+            # 메인 복장과 서브 복장을 세로로 배치 (왼쪽 정렬, 추가 아이템이 있으면 함께 표시)
+            outfit_html = f"<div class='outfit-item'>{outfit_main}</div><div class='outfit-item'>{outfit_sub}</div>"
             if extra_item:
-                st.markdown(f"<div style='text-align: left; font-size: 20px; color: #666; margin: 2px 0; line-height: 1.2; padding: 0 2px;'>{extra_item}</div>", unsafe_allow_html=True)
+                outfit_html += f"<div class='outfit-item outfit-extra'>{extra_item}</div>"
+            st.markdown(outfit_html, unsafe_allow_html=True)
         
         # 사망률 결과 표시
         if mortality_result:
             st.subheader("💀 사망률 예측 결과")
             
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric(
-                    "예상 사망률",
-                    f"{mortality_result['mortality_rate']}",
-                    help="10만명당 사망자 수"
-                )
-            
-            with col2:
-                st.metric(
-                    "위험 수준",
-                    mortality_result['risk_level']
-                )
-            
-            with col3:
-                st.metric(
-                    "하한값",
-                    f"{mortality_result['lower_bound']}"
-                )
-            
-            with col4:
-                st.metric(
-                    "상한값",
-                    f"{mortality_result['upper_bound']}"
-                )
+            self.create_metric_row([
+                ("예상 사망률", mortality_result['mortality_rate'], "10만명당 사망자 수"),
+                ("위험 수준", mortality_result['risk_level']),
+                ("하한값", mortality_result['lower_bound']),
+                ("상한값", mortality_result['upper_bound'])
+            ])
     
     def create_tabs(self) -> Tuple:
         """탭을 생성합니다."""
@@ -297,9 +264,10 @@ class UIComponents:
         """필터 옵션을 표시합니다."""
         st.subheader("🔍 데이터 필터링")
         
-        # 기온 범위 필터 (더 유연한 설정)
-        temp_min = float(data['temperature'].min())
-        temp_max = float(data['temperature'].max())
+        # 기온 범위 필터 (더 유연한 설정, 기온 배열은 한 번만 추출)
+        temperatures = data['temperature'].to_numpy()
+        temp_min = float(np.nanmin(temperatures))
+        temp_max = float(np.nanmax(temperatures))
         default_min = max(temp_min - 10, -30)  # 최소값보다 10도 낮게, 최소 -30도
         
         min_temp = st.slider(
@@ -312,7 +280,7 @@ class UIComponents:
         )
         
         # 현재 필터링된 데이터 수 표시
-        filtered_count = len(data[data['temperature'] >= min_temp])
+        filtered_count = int(np.count_nonzero(temperatures >= min_temp))
         if filtered_count == len(data):
             st.success(f"📊 모든 데이터 표시 중: {filtered_count}개")
         else:
@@ -347,6 +315,33 @@ class UIComponents:
         """메트릭 카드를 생성합니다."""
         st.metric(title, value, help=help_text)
     
+    @staticmethod
+    def create_metric_row(metrics: List[Tuple]):
+        """여러 메트릭을 한 번의 HTML 렌더링으로 가로 배치합니다 (인스턴스 상태를 쓰지 않아 utils에서도 사용).
+        
+        metrics: (제목, 값) 또는 (제목, 값, 설명) 튜플 목록
+        """
+        cards = []
+        for metric in metrics:
+            title, value = metric[0], metric[1]
+            caption = metric[2] if len(metric) > 2 else ""
+            caption_html = (
+                f"<div class='metric-caption'>{html.escape(str(caption))}</div>"
+                if caption else ""
+            )
+            cards.append(
+                "<div class='metric-card'>"
+                f"<div class='metric-title'>{html.escape(str(title))}</div>"
+                f"<div class='metric-value'>{html.escape(str(value))}</div>"
+                f"{caption_html}"
+                "</div>"
+            )
+        
+        st.markdown(
+            f"<div class='metric-row'>{''.join(cards)}</div>",
+            unsafe_allow_html=True
+        )
+    
     def create_progress_bar(self, current: int, total: int, label: str = "진행률"):
         """진행률 바를 생성합니다."""
         progress = current / total if total > 0 else 0
@@ -8,7 +8,35 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import streamlit as st
-from typing import Dict
+from typing import Dict, Tuple
+
+from ui_components import UIComponents
+
+
+# 대체 데이터용 월별 기본 기상 특성 (인덱스 = 월, 0번은 사용하지 않음)
+# 열: 기본 기온, 기본 습도, 기온 변동폭, 습도 변동폭
+_SPRING = (15, 55, 8, 15)
+_SUMMER = (25, 70, 6, 20)
+_AUTUMN = (18, 60, 7, 15)
+_WINTER = (2, 50, 6, 20)
+FALLBACK_MONTHLY_CLIMATE = np.array([
+    _WINTER,
+    _WINTER, _WINTER, _SPRING, _SPRING, _SPRING, _SUMMER,
+    _SUMMER, _SUMMER, _AUTUMN, _AUTUMN, _AUTUMN, _WINTER
+], dtype=np.float64)
+
+# 대체 데이터용 도시별 기온/습도 보정값
+FALLBACK_CITY_MODIFIERS = {
+    "서울": {"temp": 0, "humidity": 0},
+    "부산": {"temp": 2, "humidity": 10},
+    "대구": {"temp": 1, "humidity": -5},
+    "인천": {"temp": -1, "humidity": 5},
+    "광주": {"temp": 1, "humidity": 5},
+    "대전": {"temp": 0, "humidity": 0},
+    "울산": {"temp": 1, "humidity": 5},
+    "제주": {"temp": 3, "humidity": 15}
+}
+_DEFAULT_CITY_MODIFIER = {"temp": 0, "humidity": 0}
 
 
 def load_environment_variables():
@@ -33,78 +61,66 @@ def load_environment_variables():
         return None
 
 
+def build_fallback_frame(city: str, dates, include_range: bool = True) -> pd.DataFrame:
+    """날짜 배열 전체에 대해 대체 기상 데이터를 열 단위로 한 번에 생성합니다.
+    
+    월별 기본 특성과 도시별 보정을 반영하며, include_range=True이면 최고/최저 기온도 생성합니다.
+    """
+    dates = pd.DatetimeIndex(dates)
+    n = len(dates)
+    months = dates.month.to_numpy()
+    
+    # 월별 기본 기상 특성 (월 번호로 조회표에서 열 단위로 가져옴)
+    base_temp, base_humidity, temp_variation, humidity_variation = FALLBACK_MONTHLY_CLIMATE[months].T
+    
+    # 도시별 기후 특성 반영
+    modifier = FALLBACK_CITY_MODIFIERS.get(city, _DEFAULT_CITY_MODIFIER)
+    
+    # 평균 기온과 습도 생성 (정규분포 기반)
+    avg_temperature = base_temp + modifier["temp"] + np.random.normal(0, temp_variation, n)
+    avg_humidity = base_humidity + modifier["humidity"] + np.random.normal(0, humidity_variation, n)
+    
+    # 모든 행이 같은 도시이므로 1바이트 코드 하나짜리 범주형으로 저장
+    columns = {'date': dates, 'city': pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[city])}
+    
+    if include_range:
+        # 최고/최저 기온 생성 (평균 기온 기준으로 변동)
+        temp_range = temp_variation * 1.5
+        max_temperature = np.clip(avg_temperature + np.random.uniform(0, temp_range, n), -20, 40)
+        min_temperature = np.clip(avg_temperature - np.random.uniform(0, temp_range, n), -20, 40)
+        avg_temperature = np.clip(avg_temperature, -20, 40)
+        
+        # 최고/최저 기온이 평균 기온보다 적절한 순서가 되도록 조정
+        max_temperature = np.where(max_temperature < avg_temperature,
+                                   avg_temperature + np.random.uniform(1, 5, n), max_temperature)
+        min_temperature = np.where(min_temperature > avg_temperature,
+                                   avg_temperature - np.random.uniform(1, 5, n), min_temperature)
+        
+        columns['temperature'] = avg_temperature.round(1).astype(np.float32)  # 평균 기온
+        columns['temp_max'] = max_temperature.round(1).astype(np.float32)     # 최고 기온
+        columns['temp_min'] = min_temperature.round(1).astype(np.float32)     # 최저 기온
+    else:
+        columns['temperature'] = np.clip(avg_temperature, -20, 40).round(1).astype(np.float32)
+    
+    # 값 범위 제한
+    columns['humidity'] = np.clip(avg_humidity, 0, 100).round(1).astype(np.float32)  # 평균 습도
+    columns['month'] = months.astype(np.int8)
+    columns['year'] = dates.year.to_numpy().astype(np.int16)
+    
+    return pd.DataFrame(columns)
+
+
 def generate_fallback_data(city: str, years: list) -> pd.DataFrame:
     """API 실패 시 사용할 대체 데이터를 생성합니다."""
     
     st.info(f"📊 {city}의 대체 데이터를 생성합니다...")
     
-    all_data = []
+    # 해당 년도들의 1월 1일부터 12월 31일까지
+    dates = pd.DatetimeIndex(np.concatenate([
+        pd.date_range(datetime(year, 1, 1), datetime(year, 12, 31), freq='D').to_numpy() for year in years
+    ])) if years else pd.DatetimeIndex([])
     
-    for year in years:
-        # 해당 년도의 1월 1일부터 12월 31일까지
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
-        
-        current_date = start_date
-        while current_date <= end_date:
-            month = current_date.month
-            
-            # 월별 기본 기상 특성
-            if month in [3, 4, 5]:
-                base_temp = 15
-                base_humidity = 55
-                temp_variation = 8
-                humidity_variation = 15
-            elif month in [6, 7, 8]:
-                base_temp = 25
-                base_humidity = 70
-                temp_variation = 6
-                humidity_variation = 20
-            elif month in [9, 10, 11]:
-                base_temp = 18
-                base_humidity = 60
-                temp_variation = 7
-                humidity_variation = 15
-            else:
-                base_temp = 2
-                base_humidity = 50
-                temp_variation = 6
-                humidity_variation = 20
-            
-            # 도시별 기후 특성 반영
-            city_modifiers = {
-                "서울": {"temp": 0, "humidity": 0},
-                "부산": {"temp": 2, "humidity": 10},
-                "대구": {"temp": 1, "humidity": -5},
-                "인천": {"temp": -1, "humidity": 5},
-                "광주": {"temp": 1, "humidity": 5},
-                "대전": {"temp": 0, "humidity": 0},
-                "울산": {"temp": 1, "humidity": 5},
-                "제주": {"temp": 3, "humidity": 15}
-            }
-            
-            modifier = city_modifiers.get(city, {"temp": 0, "humidity": 0})
-            
-            # 기온과 습도 생성 (정규분포 기반)
-            temperature = base_temp + modifier["temp"] + np.random.normal(0, temp_variation)
-            humidity = base_humidity + modifier["humidity"] + np.random.normal(0, humidity_variation)
-            
-            # 값 범위 제한
-            temperature = max(-20, min(40, temperature))
-            humidity = max(0, min(100, humidity))
-            
-            all_data.append({
-                'date': current_date,
-                'city': city,
-                'temperature': round(temperature, 1),
-                'humidity': round(humidity, 1),
-                'month': month,
-                'year': year
-            })
-            
-            current_date += timedelta(days=1)
-    
-    df = pd.DataFrame(all_data)
+    df = build_fallback_frame(city, dates, include_range=False)
     st.success(f"✅ {city}의 {len(years)}년 대체 데이터 생성 완료 ({len(df)}개 데이터)")
     
     return df
@@ -115,82 +131,11 @@ def generate_fallback_data_recent(city: str, days: int) -> pd.DataFrame:
     
     st.info(f"📊 {city}의 최근 {days}일 대체 데이터를 생성합니다 (오늘 제외)...")
     
-    all_data = []
-    end_date = datetime.now() - timedelta(days=1)  # 어제까지 (오늘 제외)
+    # 어제부터 과거 방향으로 (오늘 제외)
+    end_date = datetime.now() - timedelta(days=1)
+    dates = pd.date_range(end=end_date, periods=days, freq='D')[::-1]
     
-    for i in range(days):
-        current_date = end_date - timedelta(days=i)
-        month = current_date.month
-        
-        # 월별 기본 기상 특성
-        if month in [3, 4, 5]:
-            base_temp = 15
-            base_humidity = 55
-            temp_variation = 8
-            humidity_variation = 15
-        elif month in [6, 7, 8]:
-            base_temp = 25
-            base_humidity = 70
-            temp_variation = 6
-            humidity_variation = 20
-        elif month in [9, 10, 11]:
-            base_temp = 18
-            base_humidity = 60
-            temp_variation = 7
-            humidity_variation = 15
-        else:
-            base_temp = 2
-            base_humidity = 50
-            temp_variation = 6
-            humidity_variation = 20
-        
-        # 도시별 기후 특성 반영
-        city_modifiers = {
-            "서울": {"temp": 0, "humidity": 0},
-            "부산": {"temp": 2, "humidity": 10},
-            "대구": {"temp": 1, "humidity": -5},
-            "인천": {"temp": -1, "humidity": 5},
-            "광주": {"temp": 1, "humidity": 5},
-            "대전": {"temp": 0, "humidity": 0},
-            "울산": {"temp": 1, "humidity": 5},
-            "제주": {"temp": 3, "humidity": 15}
-        }
-        
-        modifier = city_modifiers.get(city, {"temp": 0, "humidity": 0})
-        
-        # 평균 기온과 습도 생성 (정규분포 기반)
-        avg_temperature = base_temp + modifier["temp"] + np.random.normal(0, temp_variation)
-        avg_humidity = base_humidity + modifier["humidity"] + np.random.normal(0, humidity_variation)
-        
-        # 최고/최저 기온 생성 (평균 기온 기준으로 변동)
-        temp_range = temp_variation * 1.5
-        max_temperature = avg_temperature + np.random.uniform(0, temp_range)
-        min_temperature = avg_temperature - np.random.uniform(0, temp_range)
-        
-        # 값 범위 제한
-        avg_temperature = max(-20, min(40, avg_temperature))
-        max_temperature = max(-20, min(40, max_temperature))
-        min_temperature = max(-20, min(40, min_temperature))
-        avg_humidity = max(0, min(100, avg_humidity))
-        
-        # 최고/최저 기온이 평균 기온보다 적절한 순서가 되도록 조정
-        if max_temperature < avg_temperature:
-            max_temperature = avg_temperature + np.random.uniform(1, 5)
-        if min_temperature > avg_temperature:
-            min_temperature = avg_temperature - np.random.uniform(1, 5)
-        
-        all_data.append({
-            'date': current_date,
-            'city': city,
-            'temperature': round(avg_temperature, 1),  # 평균 기온
-            'temp_max': round(max_temperature, 1),     # 최고 기온
-            'temp_min': round(min_temperature, 1),     # 최저 기온
-            'humidity': round(avg_humidity, 1),        # 평균 습도
-            'month': month,
-            'year': current_date.year
-        })
-    
-    df = pd.DataFrame(all_data)
+    df = build_fallback_frame(city, dates)
     st.success(f"✅ {city}의 최근 {days}일 대체 데이터 생성 완료 ({len(df)}개 데이터, 오늘 제외)")
     
     return df
@@ -281,6 +226,17 @@ def detect_outliers(data: pd.Series, threshold: float = 2.0) -> list:
     return outliers
 
 
+def linear_trend(values) -> Tuple[float, float]:
+    """0, 1, 2, ... 순서 값에 대한 1차 회귀의 (기울기, 절편)을 닫힌 식으로 계산합니다 (np.polyfit 대체)."""
+    y = np.asarray(values, dtype=np.float64)
+    dx = np.arange(len(y), dtype=np.float64)
+    x_mean = dx.mean()
+    dx -= x_mean
+    y_mean = y.mean()
+    slope = np.dot(dx, y - y_mean) / np.dot(dx, dx)
+    return slope, y_mean - slope * x_mean
+
+
 def analyze_trends(data: pd.DataFrame) -> dict:
     """30일 데이터의 트렌드를 분석합니다."""
     trends = {}
@@ -288,7 +244,7 @@ def analyze_trends(data: pd.DataFrame) -> dict:
     # 기온 트렌드
     temp_data = data['temperature'].values
     if len(temp_data) > 1:
-        temp_slope = np.polyfit(range(len(temp_data)), temp_data, 1)[0]
+        temp_slope, _ = linear_trend(temp_data)
         trends['temperature_trend'] = {
             'slope': round(temp_slope, 3),
             'direction': '상승' if temp_slope > 0.1 else '하락' if temp_slope < -0.1 else '안정',
@@ -298,7 +254,7 @@ def analyze_trends(data: pd.DataFrame) -> dict:
     # 습도 트렌드
     humidity_data = data['humidity'].values
     if len(humidity_data) > 1:
-        humidity_slope = np.polyfit(range(len(humidity_data)), humidity_data, 1)[0]
+        humidity_slope, _ = linear_trend(humidity_data)
         trends['humidity_trend'] = {
             'slope': round(humidity_slope, 3),
             'direction': '상승' if humidity_slope > 0.5 else '하락' if humidity_slope < -0.5 else '안정',
@@ -406,6 +362,33 @@ def format_date_for_api(date: datetime) -> str:
 
 
 
+def dataframe_fingerprint(data: pd.DataFrame) -> tuple:
+    """캐시 키로 사용할 데이터프레임의 가벼운 지문을 계산합니다 (전체 해싱 생략)."""
+    if data.empty:
+        return (0, tuple(data.columns))
+    
+    # 숫자형 열 합계를 모두 포함 (같은 기상 데이터에서 파생된 사망률 등도 구분)
+    numeric_sums = tuple(
+        float(np.nansum(data[col].to_numpy(dtype=np.float64)))
+        for col in data.select_dtypes('number').columns
+    )
+    
+    return (
+        data.shape,
+        tuple(data.columns),
+        data['date'].iloc[0],
+        data['date'].iloc[-1],
+        numeric_sums
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+def combine_for_plot(historical_data: pd.DataFrame, predictions: pd.DataFrame) -> pd.DataFrame:
+    """과거 데이터와 예측 데이터를 차트용으로 결합합니다 (동일 입력은 캐시 재사용)."""
+    return pd.concat([historical_data, predictions], ignore_index=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: dataframe_fingerprint})
 def calculate_statistics(data: pd.DataFrame) -> Dict:
     """기상 데이터의 기본 통계를 계산합니다."""
     if data.empty:
@@ -453,11 +436,14 @@ def calculate_statistics(data: pd.DataFrame) -> Dict:
     
     # 최고/최저 기온 정보가 있는 경우 추가
     if 'temp_max' in data.columns and 'temp_min' in data.columns:
+        # 두 열의 평균/최소/최대를 한 번의 집계로 계산
+        range_stats = data[['temp_max', 'temp_min']].agg(['mean', 'min', 'max'])
+        temp_max_stats, temp_min_stats = range_stats['temp_max'], range_stats['temp_min']
         stats['기온 통계 (°C)'].update({
-            '일 최고 기온 평균': round(data['temp_max'].mean(), 1),
-            '일 최저 기온 평균': round(data['temp_min'].mean(), 1),
-            '최고 기온 범위': f"{data['temp_max'].min():.1f} ~ {data['temp_max'].max():.1f}",
-            '최저 기온 범위': f"{data['temp_min'].min():.1f} ~ {data['temp_min'].max():.1f}"
+            '일 최고 기온 평균': round(temp_max_stats['mean'], 1),
+            '일 최저 기온 평균': round(temp_min_stats['mean'], 1),
+            '최고 기온 범위': f"{temp_max_stats['min']:.1f} ~ {temp_max_stats['max']:.1f}",
+            '최저 기온 범위': f"{temp_min_stats['min']:.1f} ~ {temp_min_stats['max']:.1f}"
         })
     
     return stats
@@ -471,38 +457,26 @@ def display_statistics(stats: Dict):
     
     st.subheader("📊 기본 통계 정보")
     
-    # 기본 정보
+    # 기본 정보 (각 메트릭 행은 한 번의 HTML 렌더링으로 표시)
     if '기본 정보' in stats:
         basic_info = stats['기본 정보']
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("총 데이터 수", basic_info.get('총 데이터 수', 0))
-        
-        with col2:
-            st.metric("도시", basic_info.get('도시', 'N/A'))
-        
-        with col3:
-            st.metric("분석 기간", basic_info.get('분석 기간', 'N/A'))
+        UIComponents.create_metric_row([
+            ("총 데이터 수", basic_info.get('총 데이터 수', 0)),
+            ("도시", basic_info.get('도시', 'N/A')),
+            ("분석 기간", basic_info.get('분석 기간', 'N/A'))
+        ])
     
     # 기온 통계
     if '기온 통계 (°C)' in stats:
         st.subheader("🌡️ 기온 통계")
         temp_stats = stats['기온 통계 (°C)']
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("평균 기온", f"{temp_stats.get('평균 기온', 0)}°C")
-        
-        with col2:
-            st.metric("최고 기온", f"{temp_stats.get('최고 기온', 0)}°C")
-        
-        with col3:
-            st.metric("최저 기온", f"{temp_stats.get('최저 기온', 0)}°C")
-        
-        with col4:
-            st.metric("표준편차", f"{temp_stats.get('기온 표준편차', 0)}°C")
+        UIComponents.create_metric_row([
+            ("평균 기온", f"{temp_stats.get('평균 기온', 0)}°C"),
+            ("최고 기온", f"{temp_stats.get('최고 기온', 0)}°C"),
+            ("최저 기온", f"{temp_stats.get('최저 기온', 0)}°C"),
+            ("표준편차", f"{temp_stats.get('기온 표준편차', 0)}°C")
+        ])
         
         # 최고/최저 기온 정보가 있는 경우 추가 표시
         if '일 최고 기온 평균' in temp_stats:
@@ -513,19 +487,12 @@ def display_statistics(stats: Dict):
         st.subheader("💧 습도 통계")
         humidity_stats = stats['습도 통계 (%)']
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("평균 습도", f"{humidity_stats.get('평균 습도', 0)}%")
-        
-        with col2:
-            st.metric("최고 습도", f"{humidity_stats.get('최고 습도', 0)}%")
-        
-        with col3:
-            st.metric("최저 습도", f"{humidity_stats.get('최저 습도', 0)}%")
-        
-        with col4:
-            st.metric("표준편차", f"{humidity_stats.get('습도 표준편차', 0)}%")
+        UIComponents.create_metric_row([
+            ("평균 습도", f"{humidity_stats.get('평균 습도', 0)}%"),
+            ("최고 습도", f"{humidity_stats.get('최고 습도', 0)}%"),
+            ("최저 습도", f"{humidity_stats.get('최저 습도', 0)}%"),
+            ("표준편차", f"{humidity_stats.get('습도 표준편차', 0)}%")
+        ])
     
     return
 
@@ -535,7 +502,10 @@ def create_cache_key(city: str, years: list) -> str:
     return f"{city}_{'_'.join(map(str, years))}"
 
 
-def clear_cache():
-    """캐시를 초기화합니다."""
+def clear_cache(weather_api=None):
+    """캐시를 초기화합니다 (데이터 캐시, 공유 리소스 캐시와 weather_api의 디스크 캐시 모두)."""
+    if weather_api is not None:
+        weather_api.clear_disk_cache()
     st.cache_data.clear()
+    st.cache_resource.clear()
     st.success("✅ 캐시가 초기화되었습니다.") 
\ No newline at end of file
@@ -4,12 +4,117 @@ Plotly를 사용한 차트와 그래프 생성 기능을 담당합니다.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import streamlit as st
 import numpy as np
 
+from utils import dataframe_fingerprint, linear_trend
+
+# 추세 차트 다운샘플링 기준 (데이터 수, x축 구간 수)
+_ENVELOPE_THRESHOLD = 2000
+_ENVELOPE_BINS = 1200
+
+# 위험 수준별 색상 매핑
+RISK_LEVEL_COLORS = {
+    "낮음": "#2ECC71",
+    "보통": "#F39C12",
+    "높음": "#E67E22",
+    "매우 높음": "#E74C3C"
+}
+
+# 위험도 요인 색상 (1.0 미만 / 1.0 / 1.0 초과, np.sign + 1 로 인덱싱)
+RISK_FACTOR_COLORS = np.array(['#2ECC71', '#F39C12', '#E74C3C'])
+
+# 공통 격자 축 스타일 (차트마다 같은 축 딕셔너리를 새로 만들지 않고 재사용)
+_GRID_AXES_LAYOUT = go.Layout(
+    xaxis=dict(gridcolor='lightgray', zeroline=False),
+    yaxis=dict(gridcolor='lightgray', zeroline=False)
+)
+
+
+def _envelope_downsample(data: pd.DataFrame, column: str, n_bins: int = _ENVELOPE_BINS) -> pd.DataFrame:
+    """x축 구간별 처음/최소/최대/마지막 점만 남겨 긴 시계열을 축소합니다."""
+    series = data[['date', column]].dropna().sort_values('date', ignore_index=True)
+    if len(series) <= n_bins * 4:
+        return series
+    
+    # 날짜를 균등한 구간 번호로 변환
+    ticks = series['date'].to_numpy().astype('int64')
+    span = ticks[-1] - ticks[0] + 1
+    bins = np.floor((ticks - ticks[0]) / span * n_bins).astype(np.int64)
+    
+    # 구간 경계 (정렬되어 있으므로 diff로 처음/마지막 위치 계산)
+    edges = np.flatnonzero(np.diff(bins))
+    first = np.concatenate(([0], edges + 1))
+    last = np.concatenate((edges, [len(series) - 1]))
+    
+    grouped = series[column].groupby(bins)
+    keep = np.unique(np.concatenate((
+        first,
+        last,
+        grouped.idxmin().to_numpy(),
+        grouped.idxmax().to_numpy()
+    )))
+    
+    return series.iloc[keep]
+
+
+def _stack_figures(sections: list, title: str, cols: int = 1, shared_xaxes: bool = False,
+                   hovermode: str = 'x unified') -> go.Figure:
+    """열 수가 같은 여러 차트를 하나의 서브플롯 그림으로 세로로 이어 붙입니다.
+    
+    sections는 (그림, 행 수) 목록이며, 서브플롯이 아닌 단일 그림은 행 수를 None으로 지정합니다.
+    """
+    grids = []
+    for source, rows in sections:
+        is_subplot = rows is not None
+        if not is_subplot:
+            # 단일 그림은 그림 제목을 서브플롯 제목으로 사용
+            titles = [source.layout.title.text or '']
+            rows = 1
+        else:
+            titles = [annotation.text for annotation in source.layout.annotations][:rows * cols]
+        grids.append((source, rows, titles + [''] * (rows * cols - len(titles)), is_subplot))
+    
+    total_rows = sum(rows for _, rows, _, _ in grids)
+    fig = make_subplots(
+        rows=total_rows, cols=cols,
+        subplot_titles=[text for _, _, titles, _ in grids for text in titles],
+        row_heights=[(source.layout.height or 500) / rows for source, rows, _, _ in grids for _ in range(rows)],
+        vertical_spacing=min(0.1, 0.3 / total_rows),
+        horizontal_spacing=0.1,
+        shared_xaxes=shared_xaxes
+    )
+    
+    # 트레이스는 위치만 모아 두었다가 add_traces로 한 번에 추가
+    traces, trace_rows, trace_cols = [], [], []
+    offset = 0
+    for source, rows, _, is_subplot in grids:
+        for r in range(1, rows + 1):
+            for c in range(1, cols + 1):
+                if is_subplot:
+                    cell_traces, axes = source.select_traces(row=r, col=c), source.get_subplot(r, c)
+                else:
+                    cell_traces, axes = source.data, source.layout
+                for trace in cell_traces:
+                    traces.append(trace)
+                    trace_rows.append(offset + r)
+                    trace_cols.append(c)
+                fig.update_xaxes(title_text=axes.xaxis.title.text, row=offset + r, col=c)
+                fig.update_yaxes(title_text=axes.yaxis.title.text, row=offset + r, col=c)
+        offset += rows
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
+    
+    fig.update_layout(
+        title=title,
+        height=int(sum(source.layout.height or 500 for source, _, _, _ in grids)),
+        showlegend=False,
+        hovermode=hovermode
+    )
+    
+    return fig
+
 
 class WeatherVisualizer:
     """기상 데이터 시각화 클래스"""
@@ -26,12 +131,26 @@ class WeatherVisualizer:
             'winter': '#4A90E2'
         }
     
-    def create_weather_trend_chart(self, data: pd.DataFrame, title: str = "기상 트렌드") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_weather_trend_chart(_self, data: pd.DataFrame, title: str = "기상 트렌드") -> go.Figure:
         """기온과 습도 트렌드 차트를 생성합니다."""
         
         if data.empty:
             return go.Figure()
         
+        # 긴 시계열은 구간별 외곽선으로 축소
+        if len(data) > _ENVELOPE_THRESHOLD:
+            temp_data = _envelope_downsample(data, 'temperature')
+            humidity_data = _envelope_downsample(data, 'humidity')
+        else:
+            temp_data = humidity_data = data
+        
+        # 필요한 열만 연속된 numpy 배열로 한 번 추출
+        temp_dates = temp_data['date'].to_numpy()
+        temps = temp_data['temperature'].to_numpy()
+        humidity_dates = humidity_data['date'].to_numpy()
+        hums = humidity_data['humidity'].to_numpy()
+        
         # 서브플롯 생성
         fig = make_subplots(
             rows=2, cols=1,
@@ -42,12 +161,12 @@ class WeatherVisualizer:
         
         # 기온 차트
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['temperature'],
+            go.Scattergl(
+                x=temp_dates,
+                y=temps,
                 mode='lines+markers',
                 name='기온',
-                line=dict(color=self.colors['temperature'], width=2),
+                line=dict(color=_self.colors['temperature'], width=2),
                 marker=dict(size=4)
             ),
             row=1, col=1
@@ -55,12 +174,12 @@ class WeatherVisualizer:
         
         # 습도 차트
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['humidity'],
+            go.Scattergl(
+                x=humidity_dates,
+                y=hums,
                 mode='lines+markers',
                 name='습도',
-                line=dict(color=self.colors['humidity'], width=2),
+                line=dict(color=_self.colors['humidity'], width=2),
                 marker=dict(size=4)
             ),
             row=2, col=1
@@ -83,33 +202,27 @@ class WeatherVisualizer:
         
         return fig
     
-    def create_mortality_chart(self, data: pd.DataFrame, title: str = "사망률 예측") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_mortality_chart(_self, data: pd.DataFrame, title: str = "사망률 예측") -> go.Figure:
         """사망률 예측 차트를 생성합니다."""
         
         if data.empty:
             return go.Figure()
         
-        # 위험 수준별 색상 매핑
-        risk_colors = {
-            "낮음": "#2ECC71",
-            "보통": "#F39C12",
-            "높음": "#E67E22",
-            "매우 높음": "#E74C3C"
-        }
-        
-        # 색상 배열 생성
-        colors = [risk_colors.get(level, "#95A5A6") for level in data['risk_level']]
+        # 위험 수준별 색상 배열 생성 (매핑에 없는 수준은 회색)
+        risk_levels = data['risk_level'].to_numpy()
+        colors = data['risk_level'].map(RISK_LEVEL_COLORS).fillna("#95A5A6").to_numpy()
         
         fig = go.Figure()
         
         # 사망률 선 차트
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['mortality_rate'],
+            go.Scattergl(
+                x=data['date'].to_numpy(),
+                y=data['mortality_rate'].to_numpy(),
                 mode='lines+markers',
                 name='사망률',
-                line=dict(color=self.colors['mortality'], width=3),
+                line=dict(color=_self.colors['mortality'], width=3),
                 marker=dict(
                     size=8,
                     color=colors,
@@ -119,38 +232,33 @@ class WeatherVisualizer:
                             '<b>사망률:</b> %{y:.2f} (10만명당)<br>' +
                             '<b>위험수준:</b> %{customdata}<br>' +
                             '<extra></extra>',
-                customdata=data['risk_level']
+                customdata=risk_levels
             )
         )
         
         # 레이아웃 설정
         fig.update_layout(
+            _GRID_AXES_LAYOUT,
             title=title,
             xaxis_title="날짜",
             yaxis_title="사망률 (10만명당)",
             height=500,
-            hovermode='x unified',
-            yaxis=dict(
-                gridcolor='lightgray',
-                zeroline=False
-            ),
-            xaxis=dict(
-                gridcolor='lightgray',
-                zeroline=False
-            )
+            hovermode='x unified'
         )
         
         return fig
     
-    def create_risk_factors_chart(self, risk_factors: dict, title: str = "위험도 분석") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_risk_factors_chart(_self, risk_factors: dict, title: str = "위험도 분석") -> go.Figure:
         """위험도 요인 분석 차트를 생성합니다."""
         
         # 위험도 요인 데이터 준비
-        factors = list(risk_factors.keys())
-        values = list(risk_factors.values())
+        factors = np.array(list(risk_factors.keys()), dtype=object)
+        values = np.fromiter(risk_factors.values(), dtype=np.float64, count=len(risk_factors))
         
         # 색상 설정 (1.0 기준으로 색상 구분)
-        colors = ['#E74C3C' if v > 1.0 else '#2ECC71' if v < 1.0 else '#F39C12' for v in values]
+        colors = np.select([values > 1, values < 1], [RISK_FACTOR_COLORS[2], RISK_FACTOR_COLORS[0]],
+                           default=RISK_FACTOR_COLORS[1])
         
         fig = go.Figure()
         
@@ -175,29 +283,23 @@ class WeatherVisualizer:
         
         # 레이아웃 설정
         fig.update_layout(
+            _GRID_AXES_LAYOUT,
             title=title,
             xaxis_title="위험도 요인",
             yaxis_title="위험도 배수",
-            height=400,
-            yaxis=dict(
-                gridcolor='lightgray',
-                zeroline=False
-            ),
-            xaxis=dict(
-                gridcolor='lightgray',
-                zeroline=False
-            )
+            height=400
         )
         
         return fig
     
-    def create_weather_scatter_plot(self, data: pd.DataFrame, title: str) -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_weather_scatter_plot(_self, data: pd.DataFrame, title: str) -> go.Figure:
         """기온-습도 산점도를 생성합니다."""
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=data['temperature'],
-            y=data['humidity'],
+        fig.add_trace(go.Scattergl(
+            x=data['temperature'].to_numpy(),
+            y=data['humidity'].to_numpy(),
                     mode='markers',
             name='기상 데이터',
                     marker=dict(
@@ -244,19 +346,22 @@ class WeatherVisualizer:
         ### ⚠️ 주요 위험 요인
         """
         
-        # 위험 요인 추가
+        # 위험 요인 추가 (줄 단위 문자열 연결 대신 한 번에 결합)
         risk_factors = mortality_result.get('risk_factors', {})
-        for factor, value in risk_factors.items():
-            summary += f"- **{factor}**: {value:.1f}%\n"
-        
-        return summary 
+        return summary + "".join(f"- **{factor}**: {value:.1f}%\n" for factor, value in risk_factors.items())
 
-    def create_30day_pattern_chart(self, data: pd.DataFrame, title: str = "30일 패턴 분석") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_30day_pattern_chart(_self, data: pd.DataFrame, title: str = "30일 패턴 분석") -> go.Figure:
         """30일 데이터 패턴 분석 차트를 생성합니다."""
         
         if data.empty:
             return go.Figure()
         
+        # 필요한 열만 연속된 numpy 배열로 한 번 추출
+        dates = data['date'].to_numpy()
+        temps = data['temperature'].to_numpy()
+        hums = data['humidity'].to_numpy()
+        
         # 서브플롯 생성 (계절별 분포 제거하여 5개로 변경)
         fig = make_subplots(
             rows=3, cols=2,
@@ -270,12 +375,12 @@ class WeatherVisualizer:
         
         # 1. 기온 트렌드
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['temperature'],
+            go.Scattergl(
+                x=dates,
+                y=temps,
                 mode='lines+markers',
                 name='기온',
-                line=dict(color=self.colors['temperature'], width=2),
+                line=dict(color=_self.colors['temperature'], width=2),
                 marker=dict(size=6),
                 hovertemplate='<b>날짜:</b> %{x}<br><b>기온:</b> %{y:.1f}°C<extra></extra>'
             ),
@@ -284,12 +389,12 @@ class WeatherVisualizer:
         
         # 2. 습도 트렌드
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['humidity'],
+            go.Scattergl(
+                x=dates,
+                y=hums,
                 mode='lines+markers',
                 name='습도',
-                line=dict(color=self.colors['humidity'], width=2),
+                line=dict(color=_self.colors['humidity'], width=2),
                 marker=dict(size=6),
                 hovertemplate='<b>날짜:</b> %{x}<br><b>습도:</b> %{y:.1f}%<extra></extra>'
             ),
@@ -297,10 +402,10 @@ class WeatherVisualizer:
         )
         
         # 3. 기온 변동성 (이동 표준편차)
-        temp_std = data['temperature'].rolling(window=3, center=True).std()
+        temp_std = data['temperature'].rolling(window=3, center=True).std().to_numpy()
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
+            go.Scattergl(
+                x=dates,
                 y=temp_std,
                 mode='lines',
                 name='기온 변동성',
@@ -311,10 +416,10 @@ class WeatherVisualizer:
         )
         
         # 4. 습도 변동성 (이동 표준편차)
-        humidity_std = data['humidity'].rolling(window=3, center=True).std()
+        humidity_std = data['humidity'].rolling(window=3, center=True).std().to_numpy()
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
+            go.Scattergl(
+                x=dates,
                 y=humidity_std,
                 mode='lines',
                 name='습도 변동성',
@@ -326,14 +431,14 @@ class WeatherVisualizer:
         
         # 5. 기온-습도 산점도
         fig.add_trace(
-            go.Scatter(
-                x=data['temperature'],
-                y=data['humidity'],
+            go.Scattergl(
+                x=temps,
+                y=hums,
                 mode='markers',
                 name='기온-습도 관계',
                 marker=dict(
                     size=8,
-                    color=data['date'].dt.day,
+                    color=data['date'].dt.day.to_numpy(),
                     colorscale='Viridis',
                     showscale=True,
                     colorbar=dict(title="일")
@@ -344,10 +449,10 @@ class WeatherVisualizer:
         )
         
         # 6. 일별 변화율
-        temp_change = data['temperature'].pct_change() * 100
+        temp_change = data['temperature'].pct_change().to_numpy() * 100
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
+            go.Scattergl(
+                x=dates,
                 y=temp_change,
                 mode='lines+markers',
                 name='기온 변화율',
@@ -379,7 +484,8 @@ class WeatherVisualizer:
         
         return fig
 
-    def create_outlier_analysis_chart(self, data: pd.DataFrame, title: str = "이상치 분석") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_outlier_analysis_chart(_self, data: pd.DataFrame, title: str = "이상치 분석") -> go.Figure:
         """이상치 분석 차트를 생성합니다."""
         
         if data.empty:
@@ -393,22 +499,25 @@ class WeatherVisualizer:
             horizontal_spacing=0.1
         )
         
-        # 이상치 탐지 함수
-        def detect_outliers(series, threshold=2.0):
-            mean = series.mean()
-            std = series.std()
-            z_scores = abs((series - mean) / std)
+        # 이상치 탐지 함수 (numpy 불리언 마스크 반환)
+        def detect_outliers(values, threshold=2.0):
+            z_scores = np.abs((values - np.nanmean(values)) / np.nanstd(values, ddof=1))
             return z_scores > threshold
         
+        # 차트 입력은 numpy 배열로 한 번만 추출
+        dates = data['date'].to_numpy()
+        temps = data['temperature'].to_numpy(dtype=np.float64)
+        hums = data['humidity'].to_numpy(dtype=np.float64)
+        
         # 기온 이상치
-        temp_outliers = detect_outliers(data['temperature'])
+        temp_outliers = detect_outliers(temps)
         temp_normal = ~temp_outliers
         
         # 정상 데이터
         fig.add_trace(
-            go.Scatter(
-                x=data[temp_normal]['date'],
-                y=data[temp_normal]['temperature'],
+            go.Scattergl(
+                x=dates[temp_normal],
+                y=temps[temp_normal],
                 mode='markers',
                 name='정상 기온',
                 marker=dict(color='blue', size=6),
@@ -420,9 +529,9 @@ class WeatherVisualizer:
         # 이상치
         if temp_outliers.any():
             fig.add_trace(
-                go.Scatter(
-                    x=data[temp_outliers]['date'],
-                    y=data[temp_outliers]['temperature'],
+                go.Scattergl(
+                    x=dates[temp_outliers],
+                    y=temps[temp_outliers],
                     mode='markers',
                     name='기온 이상치',
                     marker=dict(color='red', size=10, symbol='x'),
@@ -432,14 +541,14 @@ class WeatherVisualizer:
             )
         
         # 습도 이상치
-        humidity_outliers = detect_outliers(data['humidity'])
+        humidity_outliers = detect_outliers(hums)
         humidity_normal = ~humidity_outliers
         
         # 정상 데이터
         fig.add_trace(
-            go.Scatter(
-                x=data[humidity_normal]['date'],
-                y=data[humidity_normal]['humidity'],
+            go.Scattergl(
+                x=dates[humidity_normal],
+                y=hums[humidity_normal],
                 mode='markers',
                 name='정상 습도',
                 marker=dict(color='green', size=6),
@@ -451,9 +560,9 @@ class WeatherVisualizer:
         # 이상치
         if humidity_outliers.any():
             fig.add_trace(
-                go.Scatter(
-                    x=data[humidity_outliers]['date'],
-                    y=data[humidity_outliers]['humidity'],
+                go.Scattergl(
+                    x=dates[humidity_outliers],
+                    y=hums[humidity_outliers],
                     mode='markers',
                     name='습도 이상치',
                     marker=dict(color='red', size=10, symbol='x'),
@@ -465,9 +574,9 @@ class WeatherVisualizer:
         # 기온 박스플롯
         fig.add_trace(
             go.Box(
-                y=data['temperature'],
+                y=temps,
                 name='기온',
-                marker_color=self.colors['temperature'],
+                marker_color=_self.colors['temperature'],
                 hovertemplate='<b>기온:</b> %{y:.1f}°C<extra></extra>'
             ),
             row=2, col=1
@@ -476,9 +585,9 @@ class WeatherVisualizer:
         # 습도 박스플롯
         fig.add_trace(
             go.Box(
-                y=data['humidity'],
+                y=hums,
                 name='습도',
-                marker_color=self.colors['humidity'],
+                marker_color=_self.colors['humidity'],
                 hovertemplate='<b>습도:</b> %{y:.1f}%<extra></extra>'
             ),
             row=2, col=2
@@ -500,7 +609,8 @@ class WeatherVisualizer:
         
         return fig
 
-    def create_trend_analysis_chart(self, data: pd.DataFrame, title: str = "트렌드 분석") -> go.Figure:
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_trend_analysis_chart(_self, data: pd.DataFrame, title: str = "트렌드 분석") -> go.Figure:
         """트렌드 분석 차트를 생성합니다."""
         
         if data.empty:
@@ -514,27 +624,31 @@ class WeatherVisualizer:
             horizontal_spacing=0.1
         )
         
+        # 차트 입력은 numpy 배열로 한 번만 추출
+        dates = data['date'].to_numpy()
+        temps = data['temperature'].to_numpy()
+        hums = data['humidity'].to_numpy()
+        
         # 1. 기온 트렌드 (선형 회귀)
-        x_numeric = list(range(len(data)))
-        z_temp = np.polyfit(x_numeric, data['temperature'], 1)
-        p_temp = np.poly1d(z_temp)
+        x_numeric = np.arange(len(data))
+        temp_slope, temp_intercept = linear_trend(temps)
         
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['temperature'],
+            go.Scattergl(
+                x=dates,
+                y=temps,
                 mode='markers',
                 name='실제 기온',
-                marker=dict(color=self.colors['temperature'], size=6),
+                marker=dict(color=_self.colors['temperature'], size=6),
                 hovertemplate='<b>날짜:</b> %{x}<br><b>기온:</b> %{y:.1f}°C<extra></extra>'
             ),
             row=1, col=1
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=p_temp(x_numeric),
+            go.Scattergl(
+                x=dates,
+                y=temp_slope * x_numeric + temp_intercept,
                 mode='lines',
                 name='트렌드선',
                 line=dict(color='red', width=3),
@@ -544,25 +658,24 @@ class WeatherVisualizer:
         )
         
         # 2. 습도 트렌드
-        z_humidity = np.polyfit(x_numeric, data['humidity'], 1)
-        p_humidity = np.poly1d(z_humidity)
+        humidity_slope, humidity_intercept = linear_trend(hums)
         
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=data['humidity'],
+            go.Scattergl(
+                x=dates,
+                y=hums,
                 mode='markers',
                 name='실제 습도',
-                marker=dict(color=self.colors['humidity'], size=6),
+                marker=dict(color=_self.colors['humidity'], size=6),
                 hovertemplate='<b>날짜:</b> %{x}<br><b>습도:</b> %{y:.1f}%<extra></extra>'
             ),
             row=1, col=2
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=data['date'],
-                y=p_humidity(x_numeric),
+            go.Scattergl(
+                x=dates,
+                y=humidity_slope * x_numeric + humidity_intercept,
                 mode='lines',
                 name='트렌드선',
                 line=dict(color='blue', width=3),
@@ -572,10 +685,10 @@ class WeatherVisualizer:
         )
         
         # 3. 기온 변화율
-        temp_change = data['temperature'].pct_change() * 100
+        temp_change = data['temperature'].pct_change().to_numpy() * 100
         fig.add_trace(
             go.Bar(
-                x=data['date'],
+                x=dates,
                 y=temp_change,
                 name='기온 변화율',
                 marker_color='orange',
@@ -585,10 +698,10 @@ class WeatherVisualizer:
         )
         
         # 4. 습도 변화율
-        humidity_change = data['humidity'].pct_change() * 100
+        humidity_change = data['humidity'].pct_change().to_numpy() * 100
         fig.add_trace(
             go.Bar(
-                x=data['date'],
+                x=dates,
                 y=humidity_change,
                 name='습도 변화율',
                 marker_color='purple',
@@ -611,4 +724,55 @@ class WeatherVisualizer:
         fig.update_yaxes(title_text="변화율 (%)", row=2, col=1)
         fig.update_yaxes(title_text="변화율 (%)", row=2, col=2)
         
-        return fig 
\ No newline at end of file
+        return fig
+
+
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_tab1_combined(_self, data: pd.DataFrame, city: str) -> go.Figure:
+        """기상 트렌드와 기온-습도 산점도를 하나의 그림으로 생성합니다."""
+        
+        if data.empty:
+            return go.Figure()
+        
+        trend_chart = _self.create_weather_trend_chart(data, f"{city} 기상 트렌드 (최근 30일, 오늘 제외)")
+        scatter_chart = _self.create_weather_scatter_plot(data, f"{city} 30일 기온-습도 산점도")
+        
+        fig = _stack_figures(
+            [(trend_chart, 2), (scatter_chart, None)],
+            f"{city} 기상 트렌드 (최근 30일, 오늘 제외)",
+            hovermode='closest'
+        )
+        # 기온/습도 트렌드는 x축(날짜)을 공유
+        fig.update_xaxes(matches='x', row=2, col=1)
+        
+        return fig
+    
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_tab2_combined(_self, data: pd.DataFrame, city: str) -> go.Figure:
+        """30일 패턴, 이상치, 트렌드 분석 차트를 하나의 그림으로 생성합니다."""
+        
+        if data.empty:
+            return go.Figure()
+        
+        pattern_chart = _self.create_30day_pattern_chart(data, f"{city} 30일 패턴 분석")
+        outlier_chart = _self.create_outlier_analysis_chart(data, f"{city} 30일 이상치 분석")
+        trend_chart = _self.create_trend_analysis_chart(data, f"{city} 30일 트렌드 분석")
+        
+        return _stack_figures(
+            [(pattern_chart, 3), (outlier_chart, 2), (trend_chart, 2)],
+            f"{city} 30일 패턴 · 이상치 · 트렌드 분석",
+            cols=2
+        )
+    
+    @st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: dataframe_fingerprint})
+    def create_tab3_combined(_self, combined_data: pd.DataFrame, mortality_trend: pd.DataFrame, city: str) -> go.Figure:
+        """예측 기상 트렌드와 사망률 트렌드를 하나의 그림으로 생성합니다."""
+        
+        if combined_data.empty:
+            return go.Figure()
+        
+        sections = [(_self.create_weather_trend_chart(combined_data, f"{city} 기상 트렌드 (30일 과거 + 예측)"), 2)]
+        if not mortality_trend.empty:
+            sections.append((_self.create_mortality_chart(mortality_trend, f"{city} 사망률 트렌드 (30일 기반)"), None))
+        
+        return _stack_figures(sections, f"{city} 기상 및 사망률 트렌드 (30일 과거 + 예측)", shared_xaxes=True)
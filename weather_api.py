@@ -3,12 +3,222 @@
 실제 기상 데이터를 가져오는 기능을 담당합니다.
 """
 
+import io
+import re
+from datetime import date, datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 import streamlit as st
 
+from ui_components import UIComponents
+
+try:
+    import diskcache
+except ImportError:
+    # 디스크 캐시는 선택 사항 (없으면 Streamlit 메모리 캐시만 사용)
+    diskcache = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson이 없으면 표준 json 모듈로 파싱 (두 모듈의 JSONDecodeError 모두 ValueError의 하위 클래스)
+    from json import loads as _json_loads
+
+
+# 디스크 캐시 위치 및 보관 기간 (지난 기간의 관측값은 바뀌지 않으므로 30일 보관)
+_DISK_CACHE_DIR = '.weather_cache'
+_DISK_CACHE_EXPIRE = 30 * 86400
+# 최근 며칠 안에 끝나는 기간은 관측값이 추가/보정될 수 있으므로 짧게 보관
+_DISK_CACHE_RECENT_DAYS = 3
+_DISK_CACHE_RECENT_EXPIRE = 6 * 3600
+_DISK_CACHE_VERSION = 2  # 저장 형식이 바뀌면 올려서 이전 항목을 무시
+
+# 주요 도시별 기상관측소 코드 (기상청 ASOS 공식 지점번호)
+# 모든 인스턴스가 공유하는 읽기 전용 매핑 (도시별로 한 번씩만 정의)
+STATION_CODES = MappingProxyType({
+    "서울": "108",      # 서울 (종로구 송월동)
+    "부산": "159",      # 부산 (기장군 기장읍)
+    "대구": "143",      # 대구 (동구 신천동)
+    "인천": "112",      # 인천 (중구 신포동)
+    "광주": "156",      # 광주 (북구 운암동)
+    "대전": "133",      # 대전 (유성구 구암동)
+    "울산": "152",      # 울산 (남구 삼산동)
+    "제주": "184",      # 제주 (제주시 아라동)
+    "춘천": "101",      # 춘천
+    "강릉": "105",      # 강릉
+    "청주": "131",      # 청주
+    "전주": "146",      # 전주
+    "목포": "165",      # 목포
+    "여수": "168",      # 여수
+    "포항": "138",      # 포항
+    "창원": "155",      # 창원
+    "거제": "185",      # 거제
+    "통영": "162",      # 통영
+    "진주": "192",      # 진주
+    "밀양": "288",      # 밀양
+    "구미": "279",      # 구미
+    "상주": "137",      # 상주
+    "안동": "136",      # 안동
+    "영주": "272",      # 영주
+    "영덕": "277",      # 영덕
+    "울진": "130",      # 울진
+    "동해": "106",      # 동해
+    "태백": "216",      # 태백
+    "정선": "217",      # 정선
+    "서산": "129",      # 서산
+    "천안": "232",      # 천안
+    "보령": "235",      # 보령
+    "부여": "236",      # 부여
+    "금산": "238",      # 금산
+    "홍천": "212",      # 홍천
+    "원주": "114",      # 원주
+    "영월": "121",      # 영월
+    "충주": "127",      # 충주
+    "제천": "221",      # 제천
+    "보은": "226",      # 보은
+    "옥천": "232",      # 옥천
+    "영동": "243",      # 영동
+    "추풍령": "135",    # 추풍령
+    "철원": "95",       # 철원
+    "동두천": "98",     # 동두천
+    "파주": "99",       # 파주
+    "양평": "202",      # 양평
+    "이천": "203",      # 이천
+    "인제": "211",      # 인제
+    "고성": "184",      # 고성
+    "속초": "90",       # 속초
+    "양양": "104",      # 양양
+    "강화": "201",      # 강화
+    "백령도": "102",    # 백령도
+    "울릉도": "115",    # 울릉도
+    "독도": "188",      # 독도
+    "서귀포": "189",    # 서귀포
+    "고산": "185",      # 고산
+    "성산": "188",      # 성산
+    "흑산도": "169",    # 흑산도
+    "완도": "170",      # 완도
+    "진도": "175",      # 진도
+    "흥해": "277",      # 흥해
+    "추자도": "184"     # 추자도
+})
+
+# 관측시각(TM) 문자열 길이별 형식
+_TM_FORMATS_BY_LENGTH = {
+    12: "%Y%m%d%H%M",         # YYYYMMDDHHMM 형식
+    8: "%Y%m%d",              # YYYYMMDD 형식
+    14: "%Y%m%d%H%M%S",       # YYYYMMDDHHMMSS 형식
+    19: "%Y-%m-%d %H:%M:%S",  # YYYY-MM-DD HH:MM:SS 형식
+    10: "%Y%m%d",             # YYYYMMDD 형식 (기존 형식)
+}
+_TM_DEFAULT_FORMAT = "%Y-%m-%d %H:%M"
+_TM_API_FORMAT = _TM_FORMATS_BY_LENGTH[12]  # API가 문서상 반환하는 형식
+
+# 결측값 표기 (텍스트 응답은 read_csv의 na_values로, JSON 응답은 숫자 변환 후 치환에 사용)
+_TEXT_MISSING_VALUES = frozenset({'-9', '-9.0', '-99', '-99.0'})
+_JSON_MISSING_VALUE = -999  # None/빈 문자열은 숫자 변환 시 NaN으로 처리
+
+# 캐시에 0.1 단위 정수로 저장하는 컬럼
+_QUANTIZED_COLUMNS = ('temperature', 'humidity')
+
+# 텍스트 응답의 데이터 라인 판별 (숫자로 시작하는 라인)
+_match_data_line = re.compile(rb'\d').match
+
+# 파싱 결과 컬럼 자료형 (기본 float64/int64 대비 메모리 절감)
+_WEATHER_DTYPES = {
+    'temperature': 'float32',
+    'humidity': 'float32',
+    'month': 'int8',
+    'year': 'int16'
+}
+
+
+def _preview_lines(lines: list, limit: int) -> str:
+    """응답 라인 앞부분을 디코딩하여 미리보기 문자열로 만듭니다."""
+    preview = b''
+    for line in lines:
+        preview += line + b'\n'
+        if len(preview) >= limit:
+            break
+    return preview[:limit].decode('euc-kr', errors='replace')
+
+
+def _disk_cache_expire(end_date: str) -> int:
+    """조회 종료일(YYYYMMDD)에 따른 디스크 캐시 보관 기간(초)을 반환합니다."""
+    days_since_end = (date.today() - datetime.strptime(end_date, '%Y%m%d').date()).days
+    return _DISK_CACHE_RECENT_EXPIRE if days_since_end <= _DISK_CACHE_RECENT_DAYS else _DISK_CACHE_EXPIRE
+
+
+def _quantize_weather_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """캐시 저장용으로 기온/습도를 10배한 int16 값(0.1 단위)으로 변환합니다.
+    
+    관측값은 소수 첫째 자리까지이므로 손실이 없고, float32 대비 크기가 절반입니다.
+    """
+    return df.assign(**{
+        col: (df[col] * 10).round().astype('int16') for col in _QUANTIZED_COLUMNS
+    })
+
+
+def _dequantize_weather_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """0.1 단위 정수로 저장된 기온/습도를 다시 실수(°C, %)로 변환합니다."""
+    return df.assign(**{
+        col: (df[col] / 10).astype('float32') for col in _QUANTIZED_COLUMNS
+    })
+
+
+def _parse_tm_strings(times: pd.Series) -> pd.Series:
+    """관측시각(TM) 문자열들을 형식별로 묶어 한 번에 datetime으로 변환합니다 (실패 시 NaT)."""
+    parsed = pd.Series(pd.NaT, index=times.index, dtype='datetime64[ns]')
+    if times.empty:
+        return parsed
+    
+    # 빠른 경로: 모든 값이 API 기본 형식(YYYYMMDDHHMM)이면 한 번에 변환
+    try:
+        return pd.to_datetime(times, format=_TM_API_FORMAT, cache=True).astype('datetime64[ns]')
+    except ValueError:
+        pass
+    
+    # ISO 형식 (시간대가 있으면 UTC 기준 시각으로 통일)
+    is_iso = times.str.contains('T', regex=False, na=False).to_numpy()
+    if is_iso.any():
+        parsed[is_iso] = pd.to_datetime(
+            times[is_iso], format='ISO8601', errors='coerce', utc=True
+        ).dt.tz_convert(None)
+    
+    # 나머지는 문자열 길이로 형식을 찾아 형식별로 한 번씩 변환
+    formats = times.str.len().map(_TM_FORMATS_BY_LENGTH).fillna(_TM_DEFAULT_FORMAT)
+    for time_format in formats[~is_iso].unique():
+        mask = (~is_iso) & (formats == time_format).to_numpy()
+        parsed[mask] = pd.to_datetime(times[mask], format=time_format, errors='coerce', cache=True)
+    
+    return parsed
+
+
+def _build_weather_frame(dates, temperatures, humidities, city: str) -> pd.DataFrame:
+    """컬럼별로 모은 날짜/기온/습도 값으로 기상 데이터프레임을 한 번에 만듭니다."""
+    dates = pd.DatetimeIndex(dates)
+    return pd.DataFrame({
+        'date': dates,
+        # 모든 행이 같은 도시이므로 1바이트 코드 하나짜리 범주형으로 저장
+        'city': pd.Categorical.from_codes(np.zeros(len(dates), dtype=np.int8), categories=[city]),
+        'temperature': temperatures,
+        'humidity': humidities,
+        'month': dates.month,
+        'year': dates.year
+    }).astype(_WEATHER_DTYPES)
+
+
+class WeatherDataUnavailableError(Exception):
+    """API 응답에 사용할 수 있는 기상 데이터가 없을 때 발생합니다 (빈 결과가 캐시되지 않도록 예외로 전달)."""
+    
+    def __init__(self, message: str, preview: str = ''):
+        super().__init__(message)
+        self.preview = preview
+
 
 class WeatherAPI:
     """기상청 API Hub 연동 클래스"""
@@ -18,215 +228,248 @@ class WeatherAPI:
         # 기상청 API Hub의 정확한 URL (일자료 기간 조회)
         self.base_url = "https://apihub.kma.go.kr/api/typ01/url/kma_sfcdd3.php"
         
-        # 주요 도시별 기상관측소 코드 (기상청 ASOS 공식 지점번호)
-        self.station_codes = {
-            "서울": "108",      # 서울 (종로구 송월동)
-            "부산": "159",      # 부산 (기장군 기장읍)
-            "대구": "143",      # 대구 (동구 신천동)
-            "인천": "112",      # 인천 (중구 신포동)
-            "광주": "156",      # 광주 (북구 운암동)
-            "대전": "133",      # 대전 (유성구 구암동)
-            "울산": "152",      # 울산 (남구 삼산동)
-            "제주": "184",      # 제주 (제주시 아라동)
-            "춘천": "101",      # 춘천
-            "강릉": "105",      # 강릉
-            "청주": "131",      # 청주
-            "전주": "146",      # 전주
-            "목포": "165",      # 목포
-            "여수": "168",      # 여수
-            "포항": "138",      # 포항
-            "창원": "155",      # 창원
-            "거제": "185",      # 거제
-            "통영": "162",      # 통영
-            "진주": "192",      # 진주
-            "밀양": "288",      # 밀양
-            "구미": "279",      # 구미
-            "상주": "137",      # 상주
-            "안동": "136",      # 안동
-            "영주": "272",      # 영주
-            "영덕": "277",      # 영덕
-            "울진": "130",      # 울진
-            "동해": "106",      # 동해
-            "태백": "216",      # 태백
-            "정선": "217",      # 정선
-            "서산": "129",      # 서산
-            "천안": "232",      # 천안
-            "보령": "235",      # 보령
-            "부여": "236",      # 부여
-            "금산": "238",      # 금산
-            "홍천": "212",      # 홍천
-            "원주": "114",      # 원주
-            "영월": "121",      # 영월
-            "충주": "127",      # 충주
-            "제천": "221",      # 제천
-            "보은": "226",      # 보은
-            "옥천": "232",      # 옥천
-            "영동": "243",      # 영동
-            "추풍령": "135",    # 추풍령
-            "철원": "95",       # 철원
-            "동두천": "98",     # 동두천
-            "파주": "99",       # 파주
-            "양평": "202",      # 양평
-            "이천": "203",      # 이천
-            "인제": "211",      # 인제
-            "고성": "184",      # 고성
-            "속초": "90",       # 속초
-            "양양": "104",      # 양양
-            "강화": "201",      # 강화
-            "백령도": "102",    # 백령도
-            "울릉도": "115",    # 울릉도
-            "독도": "188",      # 독도
-            "서귀포": "189",    # 서귀포
-            "고산": "185",      # 고산
-            "성산": "188",      # 성산
-            "흑산도": "169",    # 흑산도
-            "완도": "170",      # 완도
-            "진도": "175",      # 진도
-            "흥해": "277",      # 흥해
-            "울릉도": "115",    # 울릉도
-            "추자도": "184",    # 추자도
-            "제주": "184",      # 제주
-            "고산": "185",      # 고산
-            "성산": "188",      # 성산
-            "서귀포": "189"     # 서귀포
-        }
+        # API 키 유효성 (None: 미확인, 첫 데이터 요청 결과로 결정)
+        self._key_valid = None
+        
+        # 연결을 재사용하는 HTTP 세션 (keep-alive, 일시적 오류 시 재시도)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 파싱된 응답을 (지점, 도시, 기간) 단위로 디스크에 보관
+        self.cache = diskcache.Cache(_DISK_CACHE_DIR) if diskcache is not None else None
+        
+        # 주요 도시별 기상관측소 코드 (모듈 상수를 공유)
+        self.station_codes = STATION_CODES
+    
+    def clear_disk_cache(self):
+        """디스크에 저장된 응답 캐시를 모두 삭제합니다."""
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def close(self):
+        """HTTP 세션과 디스크 캐시를 닫습니다."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
     
     def validate_api_key(self) -> bool:
-        """API 키 유효성을 검증합니다."""
+        """API 키 유효성을 검증합니다.
+        
+        별도 검증 요청은 보내지 않고, 데이터 요청이 401/403으로 거부된 적이 있으면 무효로 판단합니다.
+        """
         if not self.api_key or self.api_key.strip() == "":
             return False
         
-        # 간단한 API 요청으로 키 검증
-        try:
-            url = f"{self.base_url}?authKey={self.api_key}&stn=108&tm1=20240101&tm2=20240101&help=0"
-            response = requests.get(url, timeout=10)
-            return response.status_code == 200
-        except:
-            return False
+        return self._key_valid is not False
     
-    def get_weather_data(self, city: str, start_date: str, end_date: str) -> pd.DataFrame:
-        """기상청 API에서 기상 데이터를 가져옵니다."""
+    def get_weather_data(self, city: str, start_date: str, end_date: str,
+                         quiet: bool = False) -> pd.DataFrame:
+        """기상청 API에서 기상 데이터를 가져옵니다.
+        
+        quiet=True이면 화면 메시지를 출력하지 않습니다 (작업 스레드에서 호출할 때 사용).
+        요약 정보 표시는 호출 측에서 render_summary로 합니다.
+        """
         
         if not self.api_key:
-            st.error("❌ API 키가 설정되지 않았습니다.")
+            if not quiet:
+                st.error("❌ API 키가 설정되지 않았습니다.")
             return pd.DataFrame()
         
-        try:
-            # 지점 코드 가져오기
-            station_code = self.station_codes.get(city)
-            if not station_code:
+        # 이미 거부된 키라면 요청하지 않음
+        if self._key_valid is False:
+            if not quiet:
+                st.error("❌ API 키가 유효하지 않습니다. config.env의 WEATHER_API_KEY를 확인해주세요.")
+            return pd.DataFrame()
+        
+        # 지점 코드 가져오기
+        station_code = self.station_codes.get(city)
+        if not station_code:
+            if not quiet:
                 st.error(f"❌ {city}의 지점 코드를 찾을 수 없습니다.")
-                return pd.DataFrame()
-            
-            # API 요청 URL 및 파라미터
-            url = 'https://apihub.kma.go.kr/api/typ01/url/kma_sfcdd3.php'
-            params = {
-                'authKey': self.api_key,
-                'stn': station_code,
-                'tm1': start_date,
-                'tm2': end_date,
-                'help': '0'
-            }
-            
+            return pd.DataFrame()
+        
+        if not quiet:
             st.info(f"🌤️ {city}의 {start_date} ~ {end_date} 기상 데이터를 가져오는 중...")
         
-            # API 요청
-            response = requests.get(url, params=params, timeout=30)
-            response.encoding = 'euc-kr'  # 한글 인코딩 설정
-            response.raise_for_status()
-            
-            # 응답 데이터 파싱
-            data = response.text.strip()
-            
-            # 디버깅을 위한 응답 정보 표시
-            st.info(f"📡 API 응답 상태: {response.status_code}")
-            st.info(f"📄 응답 길이: {len(data)} 문자")
-            
-            if not data or data.startswith('error'):
-                st.warning(f"⚠️ {city}의 데이터를 가져올 수 없습니다.")
-                st.info(f"📄 응답 내용: {data[:200]}...")
-                return pd.DataFrame()
-            
-            # 응답 형식 확인 및 파싱
-            weather_data = []
-            
-            # JSON 형식인지 확인
-            if data.startswith('{') or data.startswith('['):
-                try:
-                    json_data = json.loads(data)
-                    weather_data = self._parse_json_response(json_data, city)
-                except json.JSONDecodeError:
-                    st.warning("JSON 파싱 실패, 텍스트 형식으로 시도합니다.")
-                    weather_data = self._parse_text_response(data, city)
-            else:
-                # 텍스트 형식으로 파싱
-                weather_data = self._parse_text_response(data, city)
-            
-            if weather_data:
-                df = pd.DataFrame(weather_data)
-                st.success(f"✅ {city}의 기상 데이터 {len(df)}개를 성공적으로 가져왔습니다.")
-                
-                # 데이터 요약 정보 표시
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("평균 기온", f"{df['temperature'].mean():.1f}°C")
-                with col2:
-                    st.metric("평균 습도", f"{df['humidity'].mean():.1f}%")
-                with col3:
-                    st.metric("데이터 수", len(df))
-                
-                return df
-            else:
-                st.warning(f"⚠️ {city}의 유효한 기상 데이터를 찾을 수 없습니다.")
-                st.info(f"📄 응답 내용 미리보기: {data[:500]}...")
-                return pd.DataFrame()
-                
+        try:
+            df = self._fetch_weather_data(self.api_key, station_code, city, start_date, end_date, quiet)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
+                self._key_valid = False
+            if not quiet:
+                st.error(f"❌ API 요청 오류: {e}")
+            return pd.DataFrame()
         except requests.exceptions.RequestException as e:
-            st.error(f"❌ API 요청 오류: {e}")
+            if not quiet:
+                st.error(f"❌ API 요청 오류: {e}")
             return pd.DataFrame()
-        except Exception as e:
-            st.error(f"❌ 데이터 처리 오류: {e}")
+        except (KeyError, ValueError, pd.errors.ParserError) as e:
+            if not quiet:
+                st.error(f"❌ 데이터 처리 오류: {e}")
+            return pd.DataFrame()
+        except WeatherDataUnavailableError as e:
+            # 요청 자체는 성공했으므로 키는 유효 (빈 결과는 캐시되지 않아 다음 요청에서 다시 시도)
+            self._key_valid = True
+            if not quiet:
+                st.warning(f"⚠️ {e}")
+                st.info(f"📄 응답 내용: {e.preview}...")
             return pd.DataFrame()
+        
+        self._key_valid = True
+        
+        return _dequantize_weather_frame(df)
     
-    def get_historical_data(self, city: str, years: list) -> pd.DataFrame:
-        """과거 여러 년도의 기상 데이터를 가져옵니다."""
-        all_data = []
+    def render_summary(self, df: pd.DataFrame, city: str):
+        """가져온 기상 데이터의 요약 정보를 표시합니다 (get_weather_data 호출 측에서 사용)."""
+        st.success(f"✅ {city}의 기상 데이터 {len(df)}개를 성공적으로 가져왔습니다.")
         
-        for year in years:
-            # st.info(f"{city}의 {year}년 기상 데이터를 가져오는 중...")
-            
-            # 해당 년도의 1월 1일부터 12월 31일까지
-            start_date = f"{year}0101"
-            end_date = f"{year}1231"
-            
-            df = self.get_weather_data(city, start_date, end_date)
+        # 데이터 요약 정보 표시 (한 번의 HTML 행으로 렌더링)
+        UIComponents.create_metric_row([
+            ("평균 기온", f"{df['temperature'].mean():.1f}°C"),
+            ("평균 습도", f"{df['humidity'].mean():.1f}%"),
+            ("데이터 수", len(df))
+        ])
+    
+    @st.cache_data(ttl=86400, show_spinner=False)
+    def _fetch_weather_data(_self, api_key: str, station_code: str, city: str,
+                            start_date: str, end_date: str, quiet: bool = False) -> pd.DataFrame:
+        """API 요청과 응답 파싱을 수행합니다 (같은 요청은 하루 동안 캐시).
+        
+        디스크 캐시에 있으면 요청 없이 반환하고, 유효한 데이터만 디스크에 저장합니다.
+        캐시 크기를 줄이기 위해 기온/습도는 0.1 단위 정수로 반환합니다
+        (get_weather_data에서 다시 실수로 변환).
+        요청 오류와 데이터가 없는 응답은 캐시되지 않도록 예외로 전달합니다
+        (데이터가 없으면 WeatherDataUnavailableError).
+        quiet=True이면 파서까지 화면 메시지를 출력하지 않습니다 (작업 스레드용, 캐시 키에 포함되어
+        메시지를 기록한 항목이 작업 스레드에서 재생되지 않음).
+        """
+        cache_key = f"v{_DISK_CACHE_VERSION}:{station_code}:{city}:{start_date}:{end_date}"
+        if _self.cache is not None:
+            cached = _self.cache.get(cache_key)
+            if cached is not None:
+                if not quiet:
+                    st.info("💾 디스크 캐시에 저장된 데이터를 사용합니다.")
+                return cached
+        
+        # API 요청 URL 및 파라미터
+        params = {
+            'authKey': api_key,
+            'stn': station_code,
+            'tm1': start_date,
+            'tm2': end_date,
+            'help': '0'
+        }
+        
+        # API 요청 (본문 전체를 한 번에 읽지 않고 64KB 단위로 받아 라인별로 수집)
+        with _self.session.get(_self.base_url, params=params, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            status_code = response.status_code
             
-            if not df.empty:
-                all_data.append(df)
-            else:
-                # st.warning(f"{year}년 데이터를 가져올 수 없습니다.")
-                pass
+            # 숫자 행은 ASCII이므로 바이트 그대로 다루고,
+            # 한글이 포함될 수 있는 헤더/오류 메시지만 euc-kr로 디코딩
+            lines = [line for line in response.iter_lines(chunk_size=64 * 1024) if line.strip()]
+        
+        # 디버깅을 위한 응답 정보 표시
+        if not quiet:
+            st.info(f"📡 API 응답 상태: {status_code}")
+            st.info(f"📄 응답 길이: {sum(len(line) for line in lines)} 바이트 ({len(lines)}줄)")
         
-        if all_data:
-            return pd.concat(all_data, ignore_index=True)
+        first_line = lines[0].lstrip() if lines else b''
+        if not first_line or first_line.startswith(b'error'):
+            raise WeatherDataUnavailableError(f"{city}의 데이터를 가져올 수 없습니다.", _preview_lines(lines, 200))
+        
+        # 응답 형식 확인 및 파싱
+        weather_data = pd.DataFrame()
+        
+        # JSON 형식인지 확인
+        if first_line.startswith((b'{', b'[')):
+            try:
+                json_data = _json_loads(b'\n'.join(lines).decode('euc-kr'))
+                weather_data = _self._parse_json_response(json_data, city, quiet)
+            except ValueError:  # JSONDecodeError, UnicodeDecodeError 포함
+                if not quiet:
+                    st.warning("JSON 파싱 실패, 텍스트 형식으로 시도합니다.")
+                weather_data = _self._parse_text_response(lines, city, quiet)
         else:
-            return pd.DataFrame()
+            # 텍스트 형식으로 파싱
+            weather_data = _self._parse_text_response(lines, city, quiet)
+        
+        if not weather_data.empty:
+            weather_data = _quantize_weather_frame(weather_data)
+            if _self.cache is not None:
+                _self.cache.set(cache_key, weather_data, expire=_disk_cache_expire(end_date))
+            return weather_data
+        
+        raise WeatherDataUnavailableError(f"{city}의 유효한 기상 데이터를 찾을 수 없습니다.", _preview_lines(lines, 500))
     
-    def _parse_text_response(self, text_data: str, city: str) -> list:
-        """기상청 API의 텍스트 형식 응답을 파싱합니다."""
-        from datetime import datetime
-        lines = text_data.split('\n')
+    def get_historical_data(self, city: str, years: list) -> pd.DataFrame:
+        """과거 여러 년도의 기상 데이터를 가져옵니다 (연도별 요청을 병렬로 수행)."""
+        if not years:
+            return pd.DataFrame()
+        
+        # 연도별 요청은 I/O 대기가 대부분이므로 스레드로 동시에 보냄
+        # (작업 스레드에서는 Streamlit 메시지를 출력하지 않고, 진행 상황은 메인 스레드에서 표시)
+        yearly_data = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+            futures = {
+                executor.submit(self.get_weather_data, city, f"{year}0101", f"{year}1231", True): year
+                for year in years
+            }
+            for future in as_completed(futures):
+                year = futures[future]
+                df = future.result()
+                if not df.empty:
+                    yearly_data[year] = df
+                    st.info(f"📥 {city}의 {year}년 기상 데이터 {len(df)}개를 가져왔습니다.")
+        
+        # 요청한 연도 순서대로 정렬
+        all_data = [yearly_data[year] for year in years if year in yearly_data]
+        
+        if not all_data:
+            return pd.DataFrame()
+
+        # 한 해만 있으면 그대로 반환
+        if len(all_data) == 1:
+            return all_data[0]
+        
+        # 전체 행 수만큼 컬럼 버퍼를 한 번만 할당하고 연도별 구간을 채운 뒤
+        # 데이터프레임을 한 번에 생성 (concat의 추가 복사와 자료형 재추론 생략)
+        total_rows = sum(len(df) for df in all_data)
+        dates = np.empty(total_rows, dtype='datetime64[ns]')
+        temperatures = np.empty(total_rows, dtype=np.float32)
+        humidities = np.empty(total_rows, dtype=np.float32)
         
-        # 헤더 정보 추출 (실제 API 응답 구조에 맞춤)
+        offset = 0
+        for df in all_data:
+            end = offset + len(df)
+            dates[offset:end] = df['date'].to_numpy()
+            temperatures[offset:end] = df['temperature'].to_numpy()
+            humidities[offset:end] = df['humidity'].to_numpy()
+            offset = end
+        
+        return _build_weather_frame(dates, temperatures, humidities, city)
+    
+    def _parse_text_response(self, lines: list, city: str, quiet: bool = False) -> pd.DataFrame:
+        """기상청 API의 텍스트 형식 응답(바이트 라인 목록)을 파싱합니다 (quiet=True이면 메시지 생략)."""
+        # 헤더 정보 추출 (실제 API 응답 구조에 맞춤, 헤더 라인만 디코딩)
         header_line = None
-        for line in lines:
-            if line.strip().startswith('# YYMMDD'):
-                header_line = line.replace('#', '').strip()
+        data_start_index = 0
+        for i, line in enumerate(lines):
+            if line.strip().startswith(b'# YYMMDD'):
+                header_line = line.decode('euc-kr', errors='replace').replace('#', '').strip()
+                data_start_index = i + 1
                 break
         
         if not header_line:
-            st.warning("헤더 라인을 찾을 수 없습니다.")
-            return []
+            if not quiet:
+                st.warning("헤더 라인을 찾을 수 없습니다.")
+            return pd.DataFrame()
         
         # 헤더에서 컬럼 위치 찾기
         header_cols = header_line.split()
@@ -242,75 +485,80 @@ class WeatherAPI:
             
             # 첫 번째 TA는 일 평균기온, 첫 번째 HM은 일 평균습도로 사용
             if not ta_indices or not hm_indices:
-                st.warning("TA 또는 HM 컬럼을 찾을 수 없습니다.")
-                return []
+                if not quiet:
+                    st.warning("TA 또는 HM 컬럼을 찾을 수 없습니다.")
+                return pd.DataFrame()
             
             idx_ta = ta_indices[0]
             idx_hm = hm_indices[0]
             
-            st.info(f"📊 컬럼 위치 - YYMMDD: {idx_ymd}, TA: {idx_ta}, HM: {idx_hm}")
+            if not quiet:
+                st.info(f"📊 컬럼 위치 - YYMMDD: {idx_ymd}, TA: {idx_ta}, HM: {idx_hm}")
             
         except (ValueError, IndexError) as e:
-            st.warning(f"헤더 인덱스 추출 오류: {e}")
-            st.info(f"헤더 컬럼: {header_cols}")
-            return []
+            if not quiet:
+                st.warning(f"헤더 인덱스 추출 오류: {e}")
+                st.info(f"헤더 컬럼: {header_cols}")
+            return pd.DataFrame()
 
-        # 데이터 파싱
-        weather_data = []
-        for line in lines:
-            # 헤더나 구분자 라인은 제외
-            if (not line.strip() or 
-                line.startswith('#') or 
-                line.startswith('7777') or
-                not line[0].isdigit()):
-                continue
-            
-            fields = line.split()
-            
-            # 필드 수 확인
-            if len(fields) <= max(idx_ymd, idx_ta, idx_hm):
-                continue
-            
-            try:
-                # 날짜 파싱
-                date_str = fields[idx_ymd]
-                if len(date_str) == 8:  # YYYYMMDD
-                    date = datetime.strptime(date_str, "%Y%m%d")
-                else:
-                    continue
-                
-                # 기온 파싱
-                ta_str = fields[idx_ta]
-                if ta_str == '-9.0' or ta_str == '-9':
-                    continue  # 결측값
-                ta = float(ta_str)
-                
-                # 습도 파싱
-                hm_str = fields[idx_hm]
-                if hm_str == '-9.0' or hm_str == '-9':
-                    continue  # 결측값
-                hm = float(hm_str)
-                
-                weather_data.append({
-                    'date': date,
-                    'city': city,
-                    'temperature': ta,
-                    'humidity': hm,
-                    'month': date.month,
-                    'year': date.year
-                })
-                
-            except (ValueError, IndexError) as e:
-                continue
-        
-        st.info(f"📊 파싱된 데이터: {len(weather_data)}개")
+        # 데이터 구간(헤더 다음 줄 ~ '#7777END' 앞)만 잘라낸 뒤,
+        # 숫자로 시작하는 라인만 미리 컴파일한 정규식으로 한 번에 걸러냄
+        # (종료 표시는 응답 끝에 있으므로 뒤에서부터 찾음)
+        data_end_index = len(lines)
+        for i in range(len(lines) - 1, data_start_index - 1, -1):
+            if lines[i].startswith(b'#7777'):
+                data_end_index = i
+                break
+        data_lines = list(filter(_match_data_line, lines[data_start_index:data_end_index]))
+        if not data_lines:
+            if not quiet:
+                st.info("📊 파싱된 데이터: 0개")
+            return pd.DataFrame()
+        
+        # C 엔진으로 필요한 세 컬럼만 읽음 (결측값 표기는 NaN으로 처리)
+        # 컬럼 수는 헤더 기준으로 고정하여 첫 행이 짧아도 다른 행의 위치가 바뀌지 않게 하고
+        # (짧은 행은 NaN으로 채워져 아래에서 제외), 숫자가 아닌 값은 행 단위로만 버리도록 문자열로 읽음
+        rows = pd.read_csv(
+            io.BytesIO(b'\n'.join(data_lines)),
+            sep=r'\s+',
+            header=None,
+            names=range(len(header_cols)),
+            engine='c',
+            usecols=[idx_ymd, idx_ta, idx_hm],
+            dtype=str,
+            na_values=_TEXT_MISSING_VALUES,
+            on_bad_lines='skip',
+            encoding='ascii'
+        )
+        
+        # 날짜 파싱 (YYYYMMDD 형식이 아니면 NaT), 기온/습도는 숫자가 아니면 NaN
+        dates = pd.to_datetime(rows[idx_ymd], format='%Y%m%d', errors='coerce', cache=True)
+        temperatures = pd.to_numeric(rows[idx_ta], errors='coerce')
+        humidities = pd.to_numeric(rows[idx_hm], errors='coerce')
+        
+        # 결측값, 파싱 실패 행 및 물리적으로 불가능한 값 제외
+        # (범위는 DataLoader.validate_data_quality 기준과 동일)
+        valid = (
+            dates.notna()
+            & temperatures.between(-50, 50)
+            & humidities.between(0, 100)
+        )
+        dates = dates[valid]
+        
+        weather_data = _build_weather_frame(
+            dates.to_numpy(),
+            temperatures[valid].to_numpy(),
+            humidities[valid].to_numpy(),
+            city
+        )
+        
+        if not quiet:
+            st.info(f"📊 파싱된 데이터: {len(weather_data)}개")
         return weather_data
     
-    def _parse_json_response(self, data: dict, city: str) -> list:
-        """기상청 API의 JSON 형식 응답을 파싱합니다."""
+    def _parse_json_response(self, data: dict, city: str, quiet: bool = False) -> pd.DataFrame:
+        """기상청 API의 JSON 형식 응답을 파싱합니다 (quiet=True이면 메시지 생략)."""
         try:
-            weather_data = []
-            
             # API 응답 구조 확인
             if isinstance(data, list):
                 # 새로운 API Hub 형식 (직접 JSON 배열 응답)
@@ -320,70 +568,39 @@ class WeatherAPI:
                 if 'body' in data['response'] and 'items' in data['response']['body']:
                     items = data['response']['body']['items']['item']
                 else:
-                    st.error("API 응답 구조가 예상과 다릅니다.")
-                    return []
+                    if not quiet:
+                        st.error("API 응답 구조가 예상과 다릅니다.")
+                    return pd.DataFrame()
             else:
                 # 단일 객체 응답
                 items = [data]
             
             if not items:
-                return []
+                return pd.DataFrame()
             
-            # 데이터프레임으로 변환
-            for item in items:
-                try:
-                    # 새로운 API 문서에 따른 필드명 사용
-                    temp = None
-                    humidity = None
-                    
-                    # 기온 필드 (TA: 기온 °C)
-                    if 'TA' in item and item['TA'] not in [-999, None, '', '']:
-                        temp = float(item['TA'])
-                    
-                    # 습도 필드 (HM: 상대습도 %)
-                    if 'HM' in item and item['HM'] not in [-999, None, '', '']:
-                        humidity = float(item['HM'])
-                    
-                    # 시간 필드 (TM: 관측시각 KST)
-                    time_str = None
-                    if 'TM' in item and item['TM']:
-                        time_str = str(item['TM'])
-                    
-                    if temp is not None and humidity is not None and time_str:
-                        try:
-                            # 새로운 API 문서에 따른 시간 형식 처리
-                            # TM: 관측시각 (KST) - 년월일시분 형식
-                            if len(time_str) == 12:  # YYYYMMDDHHMM 형식
-                                date_obj = datetime.strptime(time_str, "%Y%m%d%H%M")
-                            elif len(time_str) == 8:  # YYYYMMDD 형식
-                                date_obj = datetime.strptime(time_str, "%Y%m%d")
-                            elif 'T' in time_str:  # ISO 형식
-                                date_obj = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                            elif len(time_str) == 14:  # YYYYMMDDHHMMSS 형식
-                                date_obj = datetime.strptime(time_str, "%Y%m%d%H%M%S")
-                            elif len(time_str) == 19:  # YYYY-MM-DD HH:MM:SS 형식
-                                date_obj = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-                            elif len(time_str) == 10: # YYYYMMDD 형식 (기존 형식)
-                                date_obj = datetime.strptime(time_str, "%Y%m%d")
-                            else:
-                                date_obj = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
-                            
-                            weather_data.append({
-                                'date': date_obj,
-                                'city': city,
-                                'temperature': temp,
-                                'humidity': humidity,
-                                'month': date_obj.month,
-                                'year': date_obj.year
-                            })
-                        except ValueError as e:
-                            continue
-                            
-                except (ValueError, KeyError) as e:
-                    continue
+            # 필요한 세 필드만 한 번씩 훑어 컬럼별 리스트로 모은 뒤 컬럼 단위로 변환
+            # (새로운 API 문서의 필드명 사용, 전체 항목을 평탄화하는 json_normalize보다 가벼움)
+            columns = {field: [item.get(field) for item in items] for field in ('TA', 'HM', 'TM')}
+            if not all(any(value is not None for value in values) for values in columns.values()):
+                return pd.DataFrame()
             
-            return weather_data
+            # 기온(TA: °C)과 습도(HM: %) - 숫자가 아니거나 결측값이면 NaN
+            temperatures = pd.to_numeric(pd.Series(columns['TA']), errors='coerce').replace(_JSON_MISSING_VALUE, np.nan)
+            humidities = pd.to_numeric(pd.Series(columns['HM']), errors='coerce').replace(_JSON_MISSING_VALUE, np.nan)
+            
+            # 관측시각(TM: KST) - 형식별로 한 번에 변환 (실패 시 NaT)
+            dates = _parse_tm_strings(pd.Series(columns['TM'], dtype='string'))
+            
+            valid = (dates.notna() & temperatures.notna() & humidities.notna()).to_numpy()
+            
+            return _build_weather_frame(
+                dates[valid],
+                temperatures.to_numpy()[valid],
+                humidities.to_numpy()[valid],
+                city
+            )
             
         except Exception as e:
-            st.error(f"JSON 파싱 중 오류: {e}")
-            return [] 
\ No newline at end of file
+            if not quiet:
+                st.error(f"JSON 파싱 중 오류: {e}")
+            return pd.DataFrame()
\ No newline at end of file
@@ -5,27 +5,96 @@
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import streamlit as st
 from typing import Dict, List, Optional, Tuple
 import xgboost as xgb
 from sklearn.preprocessing import StandardScaler, RobustScaler
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-from sklearn.model_selection import TimeSeriesSplit
+
+from ui_components import UIComponents
+
 import warnings
 warnings.filterwarnings('ignore')
 
+# 주기 특성용 사인/코사인 조회표 (인덱스 = 연중 일수 0~366 또는 월 0~12)
+_DAY_INDEX = np.arange(367)
+SEASON_SIN = np.sin(2 * np.pi * _DAY_INDEX / 365.25)
+SEASON_COS = np.cos(2 * np.pi * _DAY_INDEX / 365.25)
+WEEK_SIN = np.sin(2 * np.pi * _DAY_INDEX / 7)
+WEEK_COS = np.cos(2 * np.pi * _DAY_INDEX / 7)
+_MONTH_INDEX = np.arange(13)
+MONTH_SIN = np.sin(2 * np.pi * _MONTH_INDEX / 12)
+MONTH_COS = np.cos(2 * np.pi * _MONTH_INDEX / 12)
+
+# 예측 특성에서 원본 값을 사용하는 지연 일수와, 학습 특성의 마지막 행을 그대로 쓰는 컬럼 (특성 순서 유지)
+HISTORY_LAG_DAYS = np.array([1, 2, 3, 5, 7, 10, 14])
+HISTORY_LATEST_COLUMNS = [
+    'temp_ma_3', 'temp_ma_5', 'temp_ma_7', 'temp_ma_10', 'temp_ma_14', 'temp_ma_21',
+    'humidity_ma_3', 'humidity_ma_5', 'humidity_ma_7', 'humidity_ma_10', 'humidity_ma_14', 'humidity_ma_21',
+    'temp_median_3', 'temp_median_7', 'temp_median_14',
+    'humidity_median_3', 'humidity_median_7', 'humidity_median_14',
+    'temp_std_3', 'temp_std_7', 'temp_std_14',
+    'humidity_std_3', 'humidity_std_7', 'humidity_std_14',
+    'temp_range_3', 'temp_range_7', 'temp_range_14',
+    'humidity_range_3', 'humidity_range_7', 'humidity_range_14',
+    'temp_change_1d', 'temp_change_3d', 'humidity_change_1d', 'humidity_change_3d',
+    'temp_rank_7', 'temp_rank_14', 'temp_rank_30',
+    'humidity_rank_7', 'humidity_rank_14', 'humidity_rank_30',
+    'temp_humidity_interaction', 'temp_humidity_ratio',
+    'temp_trend_7', 'temp_trend_14', 'humidity_trend_7', 'humidity_trend_14'
+]
+
+# 이 행 수 이하의 학습 데이터는 스레드 생성/동기화 비용이 연산보다 커서 단일 스레드로 훈련
+PARALLEL_TRAINING_MIN_ROWS = 1000
+
+
+def _rolling_slope(values, window: int) -> np.ndarray:
+    """이동 창별 1차 회귀 기울기를 누적합 기반 닫힌 식으로 계산합니다.
+    
+    rolling(window, min_periods=1).apply(np.polyfit(...)[0])와 같은 결과이며,
+    창이 덜 찬 앞부분은 사용 가능한 값만으로, 값이 하나뿐인 창은 0으로 계산합니다.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    ends = np.arange(n)
+    k = np.minimum(ends + 1, window).astype(np.float64)  # 창별 데이터 수
+    starts = ends + 1 - k.astype(np.intp)
+    
+    # 창 내부 합계 (Σy, Σ(j·y))를 누적합 차로 계산
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    cum_jy = np.concatenate(([0.0], np.cumsum(ends * y)))
+    sum_y = cum_y[ends + 1] - cum_y[starts]
+    sum_xy = cum_jy[ends + 1] - cum_jy[starts] - starts * sum_y  # 창 내 상대 위치 x = j - start
+    
+    # x = 0..k-1 에 대한 Σx, Σx²는 닫힌 식
+    sum_x = k * (k - 1) / 2
+    sum_xx = (k - 1) * k * (2 * k - 1) / 6
+    denom = k * sum_xx - sum_x ** 2
+    
+    slope = np.zeros(n)
+    valid = k > 1
+    slope[valid] = (k[valid] * sum_xy[valid] - sum_x[valid] * sum_y[valid]) / denom[valid]
+    return slope
+
+
+def _frame_content_hash(data: pd.DataFrame) -> int:
+    """데이터프레임의 행 내용(값과 순서)을 해싱한 캐시 키를 계산합니다 (합계가 같은 다른 이력도 구분)."""
+    return hash(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+
+
+def _gain_importances(booster: xgb.Booster, n_features: int) -> np.ndarray:
+    """부스터의 gain 기반 특성 중요도를 합이 1이 되도록 정규화합니다 (XGBRegressor.feature_importances_와 동일)."""
+    scores = booster.get_score(importance_type='gain')
+    importances = np.array([scores.get(f'f{i}', 0.0) for i in range(n_features)], dtype=np.float32)
+    total = importances.sum()
+    return importances / total if total > 0 else importances
+
 
 class WeatherPredictor:
-    """XGBoost 기반 시간 가중치 기상 예측 클래스"""
+    """XGBoost 기반 시간 가중치 기상 예측 클래스 (훈련 결과를 인스턴스에 저장하지 않아 세션 간 공유 가능)"""
     
-    def __init__(self):
-        self.temp_model = None
-        self.humidity_model = None
-        self.scaler = RobustScaler()  # 이상치에 강한 스케일러
-        self.is_trained = False
-        self.feature_importance = {}
-        
     def calculate_time_weights(self, data: pd.DataFrame, decay_factor: float = 0.92) -> np.ndarray:
         """
         시간 가중치를 계산합니다.
@@ -39,16 +108,13 @@ class WeatherPredictor:
             시간 가중치 배열
         """
         n_samples = len(data)
-        weights = np.zeros(n_samples)
         
-        # 최신 데이터부터 역순으로 가중치 계산
-        for i in range(n_samples):
-            # 최신 데이터(인덱스 n_samples-1)가 가장 높은 가중치
-            time_distance = n_samples - 1 - i
-            weights[i] = decay_factor ** time_distance
+        # 최신 데이터(인덱스 n_samples-1)까지의 거리만큼 감쇠 (최신 데이터가 가장 높은 가중치)
+        time_distance = np.arange(n_samples - 1, -1, -1)
+        weights = np.power(decay_factor, time_distance)
         
         # 가중치 정규화 (합이 1이 되도록)
-        weights = weights / np.sum(weights)
+        weights /= weights.sum()
         
         return weights
     
@@ -62,169 +128,184 @@ class WeatherPredictor:
         Returns:
             고급 특성이 추가된 DataFrame
         """
-        df = data.copy()
-        
-        # 기본 시간 특성
-        df['day_of_year'] = df['date'].dt.dayofyear
-        df['month'] = df['date'].dt.month
-        df['day'] = df['date'].dt.day
-        df['day_of_week'] = df['date'].dt.dayofweek
-        df['quarter'] = df['date'].dt.quarter
+        # 새 특성은 딕셔너리에 모았다가 마지막에 한 번에 결합 (열마다 프레임에 삽입하지 않음)
+        features = {}
+        temp, humidity = data['temperature'], data['humidity']
+        
+        # 기본 시간 특성 (날짜 접근자는 한 번만 만들고, 정리 단계에서 만든 월 열은 재사용)
+        dates = pd.DatetimeIndex(data['date'])
+        day_of_year = dates.dayofyear.to_numpy()
+        features['day_of_year'] = day_of_year
+        if 'month' in data.columns:
+            month = data['month'].to_numpy()
+        else:
+            month = features['month'] = dates.month.to_numpy()
+        features['day'] = dates.day.to_numpy()
+        features['day_of_week'] = dates.dayofweek.to_numpy()
+        features['quarter'] = dates.quarter.to_numpy()
         
-        # 계절 특성 (사인/코사인 변환)
-        df['season_sin'] = np.sin(2 * np.pi * df['day_of_year'] / 365.25)
-        df['season_cos'] = np.cos(2 * np.pi * df['day_of_year'] / 365.25)
+        # 계절 특성 (사인/코사인 변환, 조회표 인덱싱)
+        features['season_sin'] = SEASON_SIN[day_of_year]
+        features['season_cos'] = SEASON_COS[day_of_year]
         
         # 월별 특성 (사인/코사인 변환)
-        df['month_sin'] = np.sin(2 * np.pi * df['month'] / 12)
-        df['month_cos'] = np.cos(2 * np.pi * df['month'] / 12)
+        features['month_sin'] = MONTH_SIN[month]
+        features['month_cos'] = MONTH_COS[month]
         
         # 주별 특성
-        df['week_sin'] = np.sin(2 * np.pi * df['day_of_year'] / 7)
-        df['week_cos'] = np.cos(2 * np.pi * df['day_of_year'] / 7)
+        features['week_sin'] = WEEK_SIN[day_of_year]
+        features['week_cos'] = WEEK_COS[day_of_year]
         
         # 시간 지연 특성 (lag features) - 더 많은 지연
         for lag in [1, 2, 3, 5, 7, 10, 14]:  # 다양한 지연
-            df[f'temp_lag_{lag}'] = df['temperature'].shift(lag)
-            df[f'humidity_lag_{lag}'] = df['humidity'].shift(lag)
+            features[f'temp_lag_{lag}'] = temp.shift(lag)
+            features[f'humidity_lag_{lag}'] = humidity.shift(lag)
         
         # 이동평균 특성 (다양한 윈도우)
         for window in [3, 5, 7, 10, 14, 21]:  # 다양한 윈도우
-            df[f'temp_ma_{window}'] = df['temperature'].rolling(window=window, min_periods=1).mean()
-            df[f'humidity_ma_{window}'] = df['humidity'].rolling(window=window, min_periods=1).mean()
-        
-        # 이동중앙값 특성
-        for window in [3, 7, 14]:
-            df[f'temp_median_{window}'] = df['temperature'].rolling(window=window, min_periods=1).median()
-            df[f'humidity_median_{window}'] = df['humidity'].rolling(window=window, min_periods=1).median()
-        
-        # 변동성 특성
-        for window in [3, 7, 14]:
-            df[f'temp_std_{window}'] = df['temperature'].rolling(window=window, min_periods=1).std()
-            df[f'humidity_std_{window}'] = df['humidity'].rolling(window=window, min_periods=1).std()
+            features[f'temp_ma_{window}'] = temp.rolling(window=window, min_periods=1).mean()
+            features[f'humidity_ma_{window}'] = humidity.rolling(window=window, min_periods=1).mean()
         
-        # 범위 특성
+        # 이동중앙값 / 변동성 / 범위 특성 (같은 창의 rolling 객체를 한 번만 만들어 재사용)
         for window in [3, 7, 14]:
-            df[f'temp_range_{window}'] = df['temperature'].rolling(window=window, min_periods=1).max() - \
-                                       df['temperature'].rolling(window=window, min_periods=1).min()
-            df[f'humidity_range_{window}'] = df['humidity'].rolling(window=window, min_periods=1).max() - \
-                                           df['humidity'].rolling(window=window, min_periods=1).min()
+            for series, prefix in ((temp, 'temp'), (humidity, 'humidity')):
+                rolling = series.rolling(window=window, min_periods=1)
+                features[f'{prefix}_median_{window}'] = rolling.median()
+                features[f'{prefix}_std_{window}'] = rolling.std()
+                features[f'{prefix}_range_{window}'] = rolling.max() - rolling.min()
         
         # 변화율 특성
-        df['temp_change_1d'] = df['temperature'].diff(1)
-        df['humidity_change_1d'] = df['humidity'].diff(1)
-        df['temp_change_3d'] = df['temperature'].diff(3)
-        df['humidity_change_3d'] = df['humidity'].diff(3)
+        features['temp_change_1d'] = temp.diff(1)
+        features['humidity_change_1d'] = humidity.diff(1)
+        features['temp_change_3d'] = temp.diff(3)
+        features['humidity_change_3d'] = humidity.diff(3)
         
         # 상대적 위치 특성
         for window in [7, 14, 30]:
-            df[f'temp_rank_{window}'] = df['temperature'].rolling(window=window, min_periods=1).rank(pct=True)
-            df[f'humidity_rank_{window}'] = df['humidity'].rolling(window=window, min_periods=1).rank(pct=True)
+            features[f'temp_rank_{window}'] = temp.rolling(window=window, min_periods=1).rank(pct=True)
+            features[f'humidity_rank_{window}'] = humidity.rolling(window=window, min_periods=1).rank(pct=True)
         
         # 온습도 상호작용 특성
-        df['temp_humidity_interaction'] = df['temperature'] * df['humidity'] / 100
-        df['temp_humidity_ratio'] = df['temperature'] / (df['humidity'] + 1)
+        features['temp_humidity_interaction'] = temp * humidity / 100
+        features['temp_humidity_ratio'] = temp / (humidity + 1)
         
-        # 추세 특성
+        # 추세 특성 (창별 polyfit 대신 닫힌 식 기울기)
         for window in [7, 14]:
-            df[f'temp_trend_{window}'] = df['temperature'].rolling(window=window, min_periods=1).apply(
-                lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0
-            )
-            df[f'humidity_trend_{window}'] = df['humidity'].rolling(window=window, min_periods=1).apply(
-                lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0
-            )
+            features[f'temp_trend_{window}'] = _rolling_slope(temp, window)
+            features[f'humidity_trend_{window}'] = _rolling_slope(humidity, window)
+        
+        # 원본 열과 새 특성 열을 한 번에 결합 (원본 프레임은 수정하지 않음)
+        df = pd.concat([data, pd.DataFrame(features, index=data.index)], axis=1)
         
         # 결측값 처리
         df = df.bfill().ffill()
         
         return df
     
-    def create_xgboost_model(self, target_type: str = 'temperature') -> xgb.XGBRegressor:
+    def create_xgboost_params(self, target_type: str = 'temperature', n_samples: int = 0) -> Tuple[Dict, int]:
         """
-        XGBoost 모델을 생성합니다.
+        XGBoost 학습 파라미터를 생성합니다.
         
         Args:
             target_type: 예측 대상 ('temperature' 또는 'humidity')
+            n_samples: 학습 데이터 행 수 (스레드 수 결정에 사용)
         
         Returns:
-            XGBoost 모델
+            (xgb.train 파라미터, 부스팅 라운드 수)
         """
+        # 30일 규모 데이터는 단일 스레드가 더 빠름
+        nthread = -1 if n_samples > PARALLEL_TRAINING_MIN_ROWS else 1
+        
         if target_type == 'temperature':
             # 기온 예측용 하이퍼파라미터
-            model = xgb.XGBRegressor(
-                n_estimators=300,
-                max_depth=6,
-                learning_rate=0.05,
-                subsample=0.8,
-                colsample_bytree=0.8,
-                colsample_bylevel=0.8,
-                reg_alpha=0.1,
-                reg_lambda=1.0,
-                random_state=42,
-                n_jobs=-1
-            )
+            params = {
+                'max_depth': 6,
+                'learning_rate': 0.05,
+                'subsample': 0.8,
+                'colsample_bytree': 0.8,
+                'colsample_bylevel': 0.8,
+                'reg_alpha': 0.1,
+                'reg_lambda': 1.0,
+            }
+            num_boost_round = 300
         else:
             # 습도 예측용 하이퍼파라미터
-            model = xgb.XGBRegressor(
-                n_estimators=250,
-                max_depth=5,
-                learning_rate=0.06,
-                subsample=0.85,
-                colsample_bytree=0.85,
-                colsample_bylevel=0.85,
-                reg_alpha=0.05,
-                reg_lambda=0.8,
-                random_state=42,
-                n_jobs=-1
-            )
-        
-        return model
+            params = {
+                'max_depth': 5,
+                'learning_rate': 0.06,
+                'subsample': 0.85,
+                'colsample_bytree': 0.85,
+                'colsample_bylevel': 0.85,
+                'reg_alpha': 0.05,
+                'reg_lambda': 0.8,
+            }
+            num_boost_round = 250
+        
+        params.update({
+            'objective': 'reg:squarederror',
+            'seed': 42,
+            'tree_method': 'hist',
+            'max_bin': 64,
+            'nthread': nthread
+        })
+        
+        return params, num_boost_round
     
-    def train_weighted_xgboost(self, data: pd.DataFrame, target_col: str, 
-                              feature_cols: List[str], weights: np.ndarray) -> xgb.XGBRegressor:
+    def train_weighted_xgboost(self, X_scaled: np.ndarray, y: np.ndarray, target_col: str,
+                              weights: np.ndarray) -> xgb.Booster:
         """
         가중치를 적용한 XGBoost 모델을 훈련합니다.
         
         Args:
-            data: 훈련 데이터
+            X_scaled: 스케일링된 특성 행렬
+            y: 예측 대상 값
             target_col: 예측 대상 컬럼
-            feature_cols: 특성 컬럼들
             weights: 시간 가중치
         
         Returns:
-            훈련된 XGBoost 모델
+            훈련된 XGBoost 부스터
         """
-        # 특성과 타겟 준비
-        X = data[feature_cols].values
-        y = data[target_col].values
-        
-        # 스케일링
-        X_scaled = self.scaler.fit_transform(X)
-        
         # 시간 가중치 적용
-        sample_weights = weights * len(data)  # 가중치 스케일링
-        
-        # XGBoost 모델 생성
-        model = self.create_xgboost_model(target_col)
+        sample_weights = weights * len(y)  # 가중치 스케일링
         
-        # 시계열 교차 검증
-        tscv = TimeSeriesSplit(n_splits=3)
+        # XGBoost 파라미터 생성
+        params, num_boost_round = self.create_xgboost_params(target_col, len(y))
         
-        # 모델 훈련
-        model.fit(
-            X_scaled, y,
-            sample_weight=sample_weights
-        )
+        # hist 방식용으로 특성을 미리 구간화한 QuantileDMatrix로 훈련
+        dtrain = xgb.QuantileDMatrix(X_scaled, label=y, weight=sample_weights, max_bin=params['max_bin'])
+        return xgb.train(params, dtrain, num_boost_round=num_boost_round)
+    
+    @st.cache_resource(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: _frame_content_hash})
+    def _train_models(_self, data: pd.DataFrame, feature_cols: List[str],
+                      weights: np.ndarray) -> Tuple[RobustScaler, xgb.Booster, xgb.Booster]:
+        """기온/습도 모델을 훈련하고 스케일러와 함께 반환합니다 (캐시된 모델은 예측에만 사용하고 수정하지 않음)."""
+        # 캐시 항목마다 독립된 스케일러를 지역 변수로 생성하고 (공유 예측기 상태는 건드리지 않음),
+        # 두 모델이 같은 특성을 쓰므로 훈련 스레드 시작 전에 한 번만 학습
+        scaler = RobustScaler()
+        X_scaled = scaler.fit_transform(data[feature_cols].values)
+        
+        # 기온/습도 모델을 동시에 훈련 (XGBoost는 훈련 중 GIL을 해제, Streamlit 호출은 메인 스레드에서만)
+        st.info("🌡️💧 XGBoost 기온/습도 예측 모델 훈련 중...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            temp_future = executor.submit(
+                _self.train_weighted_xgboost, X_scaled, data['temperature'].values, 'temperature', weights
+            )
+            humidity_future = executor.submit(
+                _self.train_weighted_xgboost, X_scaled, data['humidity'].values, 'humidity', weights
+            )
+            temp_model, humidity_model = temp_future.result(), humidity_future.result()
         
-        return model
+        return scaler, temp_model, humidity_model
     
-    def predict_weather(self, historical_data: pd.DataFrame, days_ahead: int) -> pd.DataFrame:
+    def predict_weather(self, historical_data: pd.DataFrame, days_ahead: int,
+                        show_diagnostics: bool = False) -> pd.DataFrame:
         """
         XGBoost 기반 시간 가중치 기상 예측을 수행합니다.
         
         Args:
             historical_data: 과거 30일 기상 데이터
             days_ahead: 예측할 일수
+            show_diagnostics: 가중치/특성 중요도 차트 표시 여부 (끄면 Plotly 차트 생성 생략)
         
         Returns:
             예측 결과 DataFrame
@@ -241,8 +322,9 @@ class WeatherPredictor:
         # 시간 가중치 계산
         weights = self.calculate_time_weights(data_with_features, decay_factor=0.92)
         
-        # 가중치 시각화
-        self._visualize_weights(weights, historical_data['date'])
+        # 가중치 시각화 (진단 차트를 켠 경우에만)
+        if show_diagnostics:
+            self._visualize_weights(weights, historical_data['date'])
         
         # 특성 컬럼 정의 (더 많은 특성)
         feature_cols = [
@@ -268,75 +350,63 @@ class WeatherPredictor:
         # 결측값이 있는 특성 제거
         available_features = [col for col in feature_cols if col in data_with_features.columns]
         
-        # 기온 모델 훈련
-        st.info("🌡️ XGBoost 기온 예측 모델 훈련 중...")
-        self.temp_model = self.train_weighted_xgboost(
-            data_with_features, 'temperature', available_features, weights
+        # 모델 훈련 (같은 학습 데이터면 재실행 간에 훈련된 모델을 재사용)
+        # 예측기는 모든 세션이 공유하므로 훈련 결과는 인스턴스가 아닌 지역 변수로만 다룸
+        scaler, temp_model, humidity_model = self._train_models(
+            data_with_features, available_features, weights
         )
         
-        # 습도 모델 훈련
-        st.info("💧 XGBoost 습도 예측 모델 훈련 중...")
-        self.humidity_model = self.train_weighted_xgboost(
-            data_with_features, 'humidity', available_features, weights
-        )
-        
-        self.is_trained = True
-        
-        # 특성 중요도 저장
-        self.feature_importance = {
-            'temperature': dict(zip(available_features, self.temp_model.feature_importances_)),
-            'humidity': dict(zip(available_features, self.humidity_model.feature_importances_))
+        # 특성 중요도 계산
+        feature_importance = {
+            'temperature': dict(zip(available_features, _gain_importances(temp_model, len(available_features)))),
+            'humidity': dict(zip(available_features, _gain_importances(humidity_model, len(available_features))))
         }
         
         # 예측 수행
-        predictions = []
         last_date = historical_data['date'].max()
+        pred_dates = last_date + pd.to_timedelta(np.arange(1, days_ahead + 1), unit='D')
         
-        for i in range(1, days_ahead + 1):
-            pred_date = last_date + timedelta(days=i)
-            
-            # 예측용 특성 생성
-            pred_features = self._create_prediction_features(
-                data_with_features, pred_date, available_features
+        # 과거 데이터 기반 특성은 모든 예측 날짜에 공통이므로 한 번만 계산
+        history_features = self._create_history_features(data_with_features)
+        
+        # 예측 날짜별 특성 행을 모아 (days_ahead, F) 행렬로 만든 뒤 스케일링/예측을 모델당 한 번만 수행
+        X_pred = np.array([
+            self._create_prediction_features(
+                data_with_features, pred_date, available_features, history_features
             )
-            
-            # 스케일링 적용
-            pred_features_scaled = self.scaler.transform([pred_features])
-            
-            # 예측 수행
-            pred_temp = self.temp_model.predict(pred_features_scaled)[0]
-            pred_humidity = self.humidity_model.predict(pred_features_scaled)[0]
-            
-            # 값 범위 제한
-            pred_temp = max(-20, min(40, pred_temp))
-            pred_humidity = max(0, min(100, pred_humidity))
-            
-            predictions.append({
-                'date': pred_date,
-                'temperature': round(pred_temp, 1),
-                'humidity': round(pred_humidity, 1),
-                'month': pred_date.month,
-                'year': pred_date.year,
-                'is_prediction': True
-            })
-        
-        predictions_df = pd.DataFrame(predictions)
+            for pred_date in pred_dates
+        ])
+        X_pred_scaled = scaler.transform(X_pred)
+        pred_temps = temp_model.inplace_predict(X_pred_scaled)
+        pred_humidities = humidity_model.inplace_predict(X_pred_scaled)
+        
+        # 값 범위 제한 후 열 단위로 결과 구성
+        predictions_df = pd.DataFrame({
+            'date': pred_dates,
+            'temperature': np.round(np.clip(pred_temps, -20, 40), 1),
+            'humidity': np.round(np.clip(pred_humidities, 0, 100), 1),
+            'month': pred_dates.month.astype(np.int64),
+            'year': pred_dates.year.astype(np.int64),
+            'is_prediction': True
+        })
     
         # 모델 성능 평가
-        self._evaluate_model_performance(data_with_features, available_features)
+        self._evaluate_model_performance(
+            data_with_features, available_features, scaler, temp_model, humidity_model
+        )
         
-        # 특성 중요도 시각화
-        self._visualize_feature_importance()
+        # 특성 중요도 시각화 (진단 차트를 켠 경우에만)
+        if show_diagnostics:
+            self._visualize_feature_importance(feature_importance)
         
         st.success(f"✅ XGBoost 기반 예측 완료! (최근 데이터 가중치: {weights[-1]:.3f})")
         
         return predictions_df
     
     def _create_prediction_features(self, data: pd.DataFrame, pred_date: datetime, 
-                                  feature_cols: List[str]) -> List[float]:
-        """예측용 특성을 생성합니다."""
-        features = []
-        
+                                  feature_cols: List[str],
+                                  history_features: Optional[np.ndarray] = None) -> np.ndarray:
+        """예측용 특성을 생성합니다 (날짜 특성 + 미리 계산한 과거 데이터 특성 행)."""
         # 기본 시간 특성
         day_of_year = pred_date.timetuple().tm_yday
         month = pred_date.month
@@ -344,121 +414,38 @@ class WeatherPredictor:
         day_of_week = pred_date.weekday()
         quarter = pred_date.quarter
         
-        features.extend([
+        calendar_features = [
             day_of_year, month, day, day_of_week, quarter,
-            np.sin(2 * np.pi * day_of_year / 365.25),
-            np.cos(2 * np.pi * day_of_year / 365.25),
-            np.sin(2 * np.pi * month / 12),
-            np.cos(2 * np.pi * month / 12),
-            np.sin(2 * np.pi * day_of_week / 7),
-            np.cos(2 * np.pi * day_of_week / 7)
-        ])
+            SEASON_SIN[day_of_year],
+            SEASON_COS[day_of_year],
+            MONTH_SIN[month],
+            MONTH_COS[month],
+            WEEK_SIN[day_of_week],
+            WEEK_COS[day_of_week]
+        ]
+        
+        # 과거 데이터 기반 특성 (예측 날짜와 무관하므로 미리 계산한 값이 있으면 재사용)
+        if history_features is None:
+            history_features = self._create_history_features(data)
         
-        # 지연 특성 (최근 데이터 사용)
-        recent_data = data.tail(14)  # 최근 14일 데이터
-        
-        if len(recent_data) >= 14:
-            features.extend([
-                recent_data['temperature'].iloc[-1],  # 1일 전
-                recent_data['temperature'].iloc[-2] if len(recent_data) >= 2 else recent_data['temperature'].iloc[-1],  # 2일 전
-                recent_data['temperature'].iloc[-3] if len(recent_data) >= 3 else recent_data['temperature'].iloc[-1],  # 3일 전
-                recent_data['temperature'].iloc[-5] if len(recent_data) >= 5 else recent_data['temperature'].iloc[-1],  # 5일 전
-                recent_data['temperature'].iloc[-7] if len(recent_data) >= 7 else recent_data['temperature'].iloc[-1],  # 7일 전
-                recent_data['temperature'].iloc[-10] if len(recent_data) >= 10 else recent_data['temperature'].iloc[-1],  # 10일 전
-                recent_data['temperature'].iloc[-14] if len(recent_data) >= 14 else recent_data['temperature'].iloc[-1],  # 14일 전
-                recent_data['humidity'].iloc[-1],  # 1일 전
-                recent_data['humidity'].iloc[-2] if len(recent_data) >= 2 else recent_data['humidity'].iloc[-1],  # 2일 전
-                recent_data['humidity'].iloc[-3] if len(recent_data) >= 3 else recent_data['humidity'].iloc[-1],  # 3일 전
-                recent_data['humidity'].iloc[-5] if len(recent_data) >= 5 else recent_data['humidity'].iloc[-1],  # 5일 전
-                recent_data['humidity'].iloc[-7] if len(recent_data) >= 7 else recent_data['humidity'].iloc[-1],  # 7일 전
-                recent_data['humidity'].iloc[-10] if len(recent_data) >= 10 else recent_data['humidity'].iloc[-1],  # 10일 전
-                recent_data['humidity'].iloc[-14] if len(recent_data) >= 14 else recent_data['humidity'].iloc[-1],  # 14일 전
-            ])
+        return np.concatenate((calendar_features, history_features))
+    
+    def _create_history_features(self, data: pd.DataFrame) -> np.ndarray:
+        """예측 날짜와 무관한 과거 데이터 기반 특성(지연, 이동 통계, 추세 등)을 생성합니다."""
+        temp = data['temperature'].to_numpy(dtype=np.float64)
+        humidity = data['humidity'].to_numpy(dtype=np.float64)
+        
+        # 지연 특성 (최근 데이터 사용, 1·2·3·5·7·10·14일 전)
+        if len(data) >= 14:
+            lag_features = np.concatenate((temp[-HISTORY_LAG_DAYS], humidity[-HISTORY_LAG_DAYS]))
         else:
             # 데이터가 부족한 경우 평균값 사용
-            avg_temp = data['temperature'].mean()
-            avg_humidity = data['humidity'].mean()
-            features.extend([avg_temp] * 14 + [avg_humidity] * 14)
-        
-        # 이동평균 특성
-        features.extend([
-            data['temp_ma_3'].iloc[-1] if 'temp_ma_3' in data.columns else data['temperature'].mean(),
-            data['temp_ma_5'].iloc[-1] if 'temp_ma_5' in data.columns else data['temperature'].mean(),
-            data['temp_ma_7'].iloc[-1] if 'temp_ma_7' in data.columns else data['temperature'].mean(),
-            data['temp_ma_10'].iloc[-1] if 'temp_ma_10' in data.columns else data['temperature'].mean(),
-            data['temp_ma_14'].iloc[-1] if 'temp_ma_14' in data.columns else data['temperature'].mean(),
-            data['temp_ma_21'].iloc[-1] if 'temp_ma_21' in data.columns else data['temperature'].mean(),
-            data['humidity_ma_3'].iloc[-1] if 'humidity_ma_3' in data.columns else data['humidity'].mean(),
-            data['humidity_ma_5'].iloc[-1] if 'humidity_ma_5' in data.columns else data['humidity'].mean(),
-            data['humidity_ma_7'].iloc[-1] if 'humidity_ma_7' in data.columns else data['humidity'].mean(),
-            data['humidity_ma_10'].iloc[-1] if 'humidity_ma_10' in data.columns else data['humidity'].mean(),
-            data['humidity_ma_14'].iloc[-1] if 'humidity_ma_14' in data.columns else data['humidity'].mean(),
-            data['humidity_ma_21'].iloc[-1] if 'humidity_ma_21' in data.columns else data['humidity'].mean(),
-        ])
+            lag_features = np.repeat([temp.mean(), humidity.mean()], len(HISTORY_LAG_DAYS))
         
-        # 중앙값 특성
-        features.extend([
-            data['temp_median_3'].iloc[-1] if 'temp_median_3' in data.columns else data['temperature'].median(),
-            data['temp_median_7'].iloc[-1] if 'temp_median_7' in data.columns else data['temperature'].median(),
-            data['temp_median_14'].iloc[-1] if 'temp_median_14' in data.columns else data['temperature'].median(),
-            data['humidity_median_3'].iloc[-1] if 'humidity_median_3' in data.columns else data['humidity'].median(),
-            data['humidity_median_7'].iloc[-1] if 'humidity_median_7' in data.columns else data['humidity'].median(),
-            data['humidity_median_14'].iloc[-1] if 'humidity_median_14' in data.columns else data['humidity'].median(),
-        ])
-        
-        # 변동성 특성
-        features.extend([
-            data['temp_std_3'].iloc[-1] if 'temp_std_3' in data.columns else data['temperature'].std(),
-            data['temp_std_7'].iloc[-1] if 'temp_std_7' in data.columns else data['temperature'].std(),
-            data['temp_std_14'].iloc[-1] if 'temp_std_14' in data.columns else data['temperature'].std(),
-            data['humidity_std_3'].iloc[-1] if 'humidity_std_3' in data.columns else data['humidity'].std(),
-            data['humidity_std_7'].iloc[-1] if 'humidity_std_7' in data.columns else data['humidity'].std(),
-            data['humidity_std_14'].iloc[-1] if 'humidity_std_14' in data.columns else data['humidity'].std(),
-        ])
+        # 이동 통계·변화율·순위·상호작용·추세 특성은 마지막 행을 한 번에 복사
+        latest_features = data[HISTORY_LATEST_COLUMNS].to_numpy(dtype=np.float64)[-1]
         
-        # 범위 특성
-        features.extend([
-            data['temp_range_3'].iloc[-1] if 'temp_range_3' in data.columns else data['temperature'].max() - data['temperature'].min(),
-            data['temp_range_7'].iloc[-1] if 'temp_range_7' in data.columns else data['temperature'].max() - data['temperature'].min(),
-            data['temp_range_14'].iloc[-1] if 'temp_range_14' in data.columns else data['temperature'].max() - data['temperature'].min(),
-            data['humidity_range_3'].iloc[-1] if 'humidity_range_3' in data.columns else data['humidity'].max() - data['humidity'].min(),
-            data['humidity_range_7'].iloc[-1] if 'humidity_range_7' in data.columns else data['humidity'].max() - data['humidity'].min(),
-            data['humidity_range_14'].iloc[-1] if 'humidity_range_14' in data.columns else data['humidity'].max() - data['humidity'].min(),
-        ])
-        
-        # 변화율 특성
-        features.extend([
-            data['temp_change_1d'].iloc[-1] if 'temp_change_1d' in data.columns else data['temperature'].diff(1).iloc[-1],
-            data['temp_change_3d'].iloc[-1] if 'temp_change_3d' in data.columns else data['temperature'].diff(3).iloc[-1],
-            data['humidity_change_1d'].iloc[-1] if 'humidity_change_1d' in data.columns else data['humidity'].diff(1).iloc[-1],
-            data['humidity_change_3d'].iloc[-1] if 'humidity_change_3d' in data.columns else data['humidity'].diff(3).iloc[-1],
-        ])
-        
-        # 상대적 위치 특성
-        features.extend([
-            data['temp_rank_7'].iloc[-1] if 'temp_rank_7' in data.columns else data['temperature'].rolling(window=7, min_periods=1).rank(pct=True).iloc[-1],
-            data['temp_rank_14'].iloc[-1] if 'temp_rank_14' in data.columns else data['temperature'].rolling(window=14, min_periods=1).rank(pct=True).iloc[-1],
-            data['temp_rank_30'].iloc[-1] if 'temp_rank_30' in data.columns else data['temperature'].rolling(window=30, min_periods=1).rank(pct=True).iloc[-1],
-            data['humidity_rank_7'].iloc[-1] if 'humidity_rank_7' in data.columns else data['humidity'].rolling(window=7, min_periods=1).rank(pct=True).iloc[-1],
-            data['humidity_rank_14'].iloc[-1] if 'humidity_rank_14' in data.columns else data['humidity'].rolling(window=14, min_periods=1).rank(pct=True).iloc[-1],
-            data['humidity_rank_30'].iloc[-1] if 'humidity_rank_30' in data.columns else data['humidity'].rolling(window=30, min_periods=1).rank(pct=True).iloc[-1],
-        ])
-        
-        # 온습도 상호작용 특성
-        features.extend([
-            data['temp_humidity_interaction'].iloc[-1] if 'temp_humidity_interaction' in data.columns else data['temperature'].iloc[-1] * data['humidity'].iloc[-1] / 100,
-            data['temp_humidity_ratio'].iloc[-1] if 'temp_humidity_ratio' in data.columns else data['temperature'].iloc[-1] / (data['humidity'].iloc[-1] + 1),
-        ])
-        
-        # 추세 특성
-        features.extend([
-            data['temp_trend_7'].iloc[-1] if 'temp_trend_7' in data.columns else data['temperature'].rolling(window=7, min_periods=1).apply(lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0),
-            data['temp_trend_14'].iloc[-1] if 'temp_trend_14' in data.columns else data['temperature'].rolling(window=14, min_periods=1).apply(lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0),
-            data['humidity_trend_7'].iloc[-1] if 'humidity_trend_7' in data.columns else data['humidity'].rolling(window=7, min_periods=1).apply(lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0),
-            data['humidity_trend_14'].iloc[-1] if 'humidity_trend_14' in data.columns else data['humidity'].rolling(window=14, min_periods=1).apply(lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) > 1 else 0),
-        ])
-        
-        return features
+        return np.concatenate((lag_features, latest_features))
     
     def _visualize_weights(self, weights: np.ndarray, dates: pd.Series):
         """시간 가중치를 시각화합니다."""
@@ -466,7 +453,7 @@ class WeatherPredictor:
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=weights,
             mode='lines+markers',
@@ -485,52 +472,42 @@ class WeatherPredictor:
         
         st.plotly_chart(fig, use_container_width=True)
         
-        # 가중치 통계 정보
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("최신 데이터 가중치", f"{weights[-1]:.3f}")
-        with col2:
-            st.metric("최고 가중치", f"{weights.max():.3f}")
-        with col3:
-            st.metric("평균 가중치", f"{weights.mean():.3f}")
-        with col4:
-            st.metric("가중치 표준편차", f"{weights.std():.3f}")
+        # 가중치 통계 정보 (한 번의 HTML 행으로 렌더링)
+        UIComponents.create_metric_row([
+            ("최신 데이터 가중치", f"{weights[-1]:.3f}"),
+            ("최고 가중치", f"{weights.max():.3f}"),
+            ("평균 가중치", f"{weights.mean():.3f}"),
+            ("가중치 표준편차", f"{weights.std():.3f}")
+        ])
     
-    def _evaluate_model_performance(self, data: pd.DataFrame, feature_cols: List[str]):
+    def _evaluate_model_performance(self, data: pd.DataFrame, feature_cols: List[str], scaler: RobustScaler,
+                                    temp_model: xgb.Booster, humidity_model: xgb.Booster):
         """예측 성능을 평가합니다."""
-        if not self.is_trained:
-            return
-        
         # 간단한 성능 평가 (교차 검증 대신)
         X = data[feature_cols].values
         y_temp = data['temperature'].values
         y_humidity = data['humidity'].values
         
         # 스케일링 적용
-        X_scaled = self.scaler.transform(X)
+        X_scaled = scaler.transform(X)
         
         # 기온 모델 성능
-        temp_pred = self.temp_model.predict(X_scaled)
+        temp_pred = temp_model.inplace_predict(X_scaled)
         temp_r2 = r2_score(y_temp, temp_pred)
         temp_mae = mean_absolute_error(y_temp, temp_pred)
         
         # 습도 모델 성능
-        humidity_pred = self.humidity_model.predict(X_scaled)
+        humidity_pred = humidity_model.inplace_predict(X_scaled)
         humidity_r2 = r2_score(y_humidity, humidity_pred)
         humidity_mae = mean_absolute_error(y_humidity, humidity_pred)
         
-        # 성능 표시
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("기온 예측 R²", f"{temp_r2:.3f}")
-            st.caption(f"MAE: {temp_mae:.2f}°C")
-        
-        with col2:
-            st.metric("습도 예측 R²", f"{humidity_r2:.3f}")
-            st.caption(f"MAE: {humidity_mae:.2f}%") 
+        # 성능 표시 (MAE는 메트릭 설명으로 함께 렌더링)
+        UIComponents.create_metric_row([
+            ("기온 예측 R²", f"{temp_r2:.3f}", f"MAE: {temp_mae:.2f}°C"),
+            ("습도 예측 R²", f"{humidity_r2:.3f}", f"MAE: {humidity_mae:.2f}%")
+        ])
 
-    def _visualize_feature_importance(self):
+    def _visualize_feature_importance(self, feature_importance: Dict[str, Dict[str, float]]):
         """특성 중요도를 시각화합니다."""
         import plotly.graph_objects as go
         
@@ -538,16 +515,16 @@ class WeatherPredictor:
         
         # 기온 모델 중요도
         fig.add_trace(go.Bar(
-            x=list(self.feature_importance['temperature'].keys()),
-            y=list(self.feature_importance['temperature'].values()),
+            x=list(feature_importance['temperature'].keys()),
+            y=list(feature_importance['temperature'].values()),
             name='기온 예측 특성 중요도',
             marker_color='blue'
         ))
         
         # 습도 모델 중요도
         fig.add_trace(go.Bar(
-            x=list(self.feature_importance['humidity'].keys()),
-            y=list(self.feature_importance['humidity'].values()),
+            x=list(feature_importance['humidity'].keys()),
+            y=list(feature_importance['humidity'].values()),
             name='습도 예측 특성 중요도',
             marker_color='green'
         ))